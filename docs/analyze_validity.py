@@ -14,55 +14,89 @@ Requirements:
 
 from __future__ import annotations
 
+import argparse
 import json
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
+import shapely
 from shapely.geometry import MultiPolygon, Polygon, box
-from shapely.validation import explain_validity
 
 from i_overlay import FillRule, OverlayRule, overlay
 
 
 def load_test_case(json_path: Path) -> tuple[list, list]:
     """Load subject and clip shapes from JSON file."""
-    with open(json_path) as f:
-        data = json.load(f)
+    # Read as bytes and let json.loads handle decoding — no TextIOWrapper pass.
+    data = json.loads(json_path.read_bytes())
 
     def convert_shapes(shapes):
-        return [[[tuple(pt) for pt in contour] for contour in shape] for shape in shapes]
+        # The pyo3 binding extracts points strictly as tuples, so only the
+        # innermost level needs converting; outer lists are used as-is.
+        return [[list(map(tuple, contour)) for contour in shape] for shape in shapes]
 
     return convert_shapes(data["subject"]), convert_shapes(data["clip"])
 
 
 def shapes_to_shapely(shapes: list) -> MultiPolygon:
     """Convert i_overlay shapes format to Shapely MultiPolygon."""
-    polygons = []
+    rings: list[np.ndarray] = []
+    owners: list[int] = []
+    n_polys = 0
     for shape in shapes:
-        if not shape:
+        if not shape or len(shape[0]) < 3:
             continue
-        exterior = list(shape[0])
-        if len(exterior) < 3:
-            continue
-        # Close ring if needed
-        if exterior[0] != exterior[-1]:
-            exterior = [*exterior, exterior[0]]
-        holes = []
+        rings.append(np.asarray(shape[0], dtype=np.float64))
+        owners.append(n_polys)
         for hole in shape[1:]:
             if len(hole) >= 3:
-                h = list(hole) if hole[0] == hole[-1] else [*list(hole), hole[0]]
-                holes.append(h)
-        try:
-            poly = Polygon(exterior, holes or None)
-            if not poly.is_empty:
-                polygons.append(poly)
-        except Exception:
-            pass
-    return MultiPolygon(polygons) if polygons else MultiPolygon()
-
-
-def plot_multipolygon(ax, geom, title: str, *, highlight_invalid: bool = True):
-    """Plot a MultiPolygon or Polygon with optional invalid highlighting."""
+                rings.append(np.asarray(hole, dtype=np.float64))
+                owners.append(n_polys)
+        n_polys += 1
+    if not n_polys:
+        return MultiPolygon()
+
+    # Build all rings in one C call over a flat coordinate buffer; linearrings
+    # closes each ring automatically when first != last.
+    coords = np.concatenate(rings)
+    indices = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+    ring_geoms = shapely.linearrings(coords, indices=indices)
+
+    owner_ids = np.asarray(owners)
+    is_exterior = np.r_[True, owner_ids[1:] != owner_ids[:-1]]
+    exteriors = ring_geoms[is_exterior]
+    hole_owners = owner_ids[~is_exterior]
+    hole_counts = np.bincount(hole_owners, minlength=n_polys)
+    if hole_counts.any():
+        holes = np.full((n_polys, hole_counts.max()), None, dtype=object)
+        cols = np.arange(hole_owners.size) - np.r_[0, np.cumsum(hole_counts)[:-1]][hole_owners]
+        holes[hole_owners, cols] = ring_geoms[~is_exterior]
+        polys = shapely.polygons(exteriors, holes=holes)
+    else:
+        polys = shapely.polygons(exteriors)
+
+    polys = polys[~shapely.is_empty(polys)]
+    return MultiPolygon(polys.tolist()) if polys.size else MultiPolygon()
+
+
+def _ring_arrays(rings: list) -> list[np.ndarray]:
+    """Extract the coordinate arrays of a list of rings in a single C call."""
+    if not rings:
+        return []
+    coords, idx = shapely.get_coordinates(rings, return_index=True)
+    return np.split(coords, np.flatnonzero(np.diff(idx)) + 1)
+
+
+def plot_multipolygon(ax, geom, title: str, *, highlight_invalid: bool = True, validities=None):
+    """Plot a MultiPolygon or Polygon with optional invalid highlighting.
+
+    `validities` is an optional per-polygon boolean sequence; when omitted it is
+    computed here in a single vectorized call rather than per polygon.
+    """
+    # Imported lazily so the analysis helpers can be used without matplotlib.
+    from matplotlib.collections import PatchCollection  # noqa: PLC0415
+    from matplotlib.patches import Polygon as MplPolygon  # noqa: PLC0415
+
     ax.set_title(title)
     ax.set_aspect("equal")
 
@@ -73,50 +107,118 @@ def plot_multipolygon(ax, geom, title: str, *, highlight_invalid: bool = True):
     else:
         geoms = []
 
-    for poly in geoms:
-        is_valid = poly.is_valid
-
-        # Plot exterior
-        x, y = poly.exterior.xy
+    if validities is None:
+        validities = shapely.is_valid(np.asarray(geoms)) if geoms else []
+
+    # Accumulate one patch per ring and draw with two add_collection calls
+    # rather than one ax.fill (artist + autoscale pass) per ring. Ring
+    # coordinates are pulled out of GEOS in one batched call per ring kind.
+    exterior_patches = [MplPolygon(ring, closed=True) for ring in _ring_arrays([poly.exterior for poly in geoms])]
+    hole_patches = [
+        MplPolygon(ring, closed=True)
+        for ring in _ring_arrays([interior for poly in geoms for interior in poly.interiors])
+    ]
+    face_colors = []
+    edge_colors = []
+    line_widths = []
+    for is_valid in validities:
         if highlight_invalid and not is_valid:
-            ax.fill(x, y, alpha=0.5, fc="red", ec="darkred", linewidth=1.5)
+            face_colors.append("red")
+            edge_colors.append("darkred")
+            line_widths.append(1.5)
         else:
-            ax.fill(x, y, alpha=0.5, fc="blue", ec="darkblue", linewidth=0.5)
-
-        # Plot holes
-        for interior in poly.interiors:
-            x, y = interior.xy
-            ax.fill(x, y, fc="white", ec="gray", linewidth=0.5)
+            face_colors.append("blue")
+            edge_colors.append("darkblue")
+            line_widths.append(0.5)
+
+    if exterior_patches:
+        ax.add_collection(
+            PatchCollection(
+                exterior_patches,
+                facecolors=face_colors,
+                edgecolors=edge_colors,
+                linewidths=line_widths,
+                alpha=0.5,
+            )
+        )
+    if hole_patches:
+        ax.add_collection(PatchCollection(hole_patches, facecolors="white", edgecolors="gray", linewidths=0.5))
+    ax.autoscale_view()
 
     ax.grid(True, alpha=0.3)
 
 
-def analyze_hole_sharing(poly: Polygon) -> list[tuple[int, int, int, list]]:
-    """Find pairs of holes that share vertices."""
-    results = []
-    for i, hole1 in enumerate(poly.interiors):
-        for j, hole2 in enumerate(poly.interiors):
-            if i >= j:
-                continue
+def _shared_vertex_pairs(coords: np.ndarray, hole_ids: np.ndarray) -> dict[tuple[int, int], list]:
+    """Map (hole_i, hole_j) pairs to the vertices they share.
+
+    Pure ndarray kernel — takes the flat (N, 2) coordinate array and a parallel
+    hole-id array, with no geometry objects in the hot path.
+    """
+    # Quantize coordinates to 10 decimal places (matching the old round(c, 10)
+    # behaviour), then fold each point into a single int64 key: dense-rank both
+    # axes and combine the ranks. Both ranks are < n_points, so the product is
+    # exact and the grouping pass sorts plain int64 instead of 16-byte records.
+    quantized = np.round(coords * 1e10).astype(np.int64)
+    _, inv_x = np.unique(quantized[:, 0], return_inverse=True)
+    uniq_y, inv_y = np.unique(quantized[:, 1], return_inverse=True)
+    keys = inv_x.astype(np.int64) * len(uniq_y) + inv_y
+    _, inverse = np.unique(keys, return_inverse=True)
+
+    order = np.argsort(inverse, kind="stable")
+    sorted_inverse = inverse[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_inverse[1:] != sorted_inverse[:-1]])
+    group_ends = np.r_[group_starts[1:], sorted_inverse.size]
+
+    shared: dict[tuple[int, int], list] = {}
+    for start, end in zip(group_starts, group_ends, strict=True):
+        if end - start < 2:
+            continue
+        idx = order[start:end]
+        owners = np.unique(hole_ids[idx])
+        if owners.size < 2:
+            continue
+        point = tuple(np.round(coords[idx[0]], 10).tolist())
+        for a in range(owners.size):
+            for b in range(a + 1, owners.size):
+                shared.setdefault((int(owners[a]), int(owners[b])), []).append(point)
 
-            h1_coords = {tuple(round(c, 10) for c in pt) for pt in hole1.coords}
-            h2_coords = {tuple(round(c, 10) for c in pt) for pt in hole2.coords}
-            shared = h1_coords & h2_coords
+    return shared
 
-            if shared:
-                results.append((i, j, len(shared), list(shared)))
 
-    return results
+def analyze_hole_sharing(poly: Polygon) -> list[tuple[int, int, int, list]]:
+    """Find pairs of holes that share vertices."""
+    holes = [np.asarray(hole.coords) for hole in poly.interiors]
+    if len(holes) < 2:
+        return []
+
+    coords = np.concatenate(holes)
+    hole_ids = np.repeat(np.arange(len(holes)), [len(h) for h in holes])
+    shared = _shared_vertex_pairs(coords, hole_ids)
+    return [(i, j, len(points), points) for (i, j), points in sorted(shared.items())]
 
 
-def print_results(ioverlay_shp: MultiPolygon, shapely_result) -> int | None:
+def print_results(
+    ioverlay_shp: MultiPolygon, shapely_result, validities: np.ndarray, ioverlay_valid: bool
+) -> int | None:
     """Print analysis results and return invalid polygon index if found."""
+    all_valid = bool(validities.all())
+    # Run GEOS validation-with-reason once: on the first invalid polygon,
+    # or on the whole geometry when every part is valid but the
+    # combination (e.g. overlapping polygons) is not.
+    invalid_idx = None if all_valid else int(np.argmax(~validities))
+    if invalid_idx is not None:
+        reason = shapely.is_valid_reason(ioverlay_shp.geoms[invalid_idx])
+    elif not ioverlay_valid:
+        reason = shapely.is_valid_reason(ioverlay_shp)
+    else:
+        reason = None
+
     print("\niOverlay result:")
     print(f"  Polygons: {len(ioverlay_shp.geoms)}")
-    print(f"  Is valid: {ioverlay_shp.is_valid}")
+    print(f"  Is valid: {ioverlay_valid}")
     print(f"  Area: {ioverlay_shp.area:.6f}")
-    if not ioverlay_shp.is_valid:
-        print(f"  Validity issue: {explain_validity(ioverlay_shp)}")
+    if reason is not None:
+        print(f"  Validity issue: {reason}")
 
     print("\nShapely result:")
     n_polys = len(shapely_result.geoms) if isinstance(shapely_result, MultiPolygon) else 1
@@ -131,37 +233,38 @@ def print_results(ioverlay_shp: MultiPolygon, shapely_result) -> int | None:
     print("Analyzing invalid polygon from iOverlay...")
     print("-" * 70)
 
-    invalid_idx = None
-    for i, poly in enumerate(ioverlay_shp.geoms):
-        if not poly.is_valid:
-            invalid_idx = i
-            print(f"\nInvalid polygon index: {i}")
-            print(f"  Exterior points: {len(poly.exterior.coords)}")
-            print(f"  Number of holes: {len(poly.interiors)}")
-            print(f"  Area: {poly.area:.6f}")
-            print(f"  Validity issue: {explain_validity(poly)}")
-
-            sharing = analyze_hole_sharing(poly)
-            if sharing:
-                print("\n  Holes sharing vertices:")
-                for h1, h2, count, points in sharing:
-                    print(f"    Holes {h1} and {h2}: {count} shared point(s)")
-                    if count >= 2:
-                        print("      WARNING: 2+ shared points creates disconnected interior!")
-                    for pt in points[:3]:
-                        print(f"      - ({pt[0]:.6f}, {pt[1]:.6f})")
-            break
+    if invalid_idx is not None:
+        poly = ioverlay_shp.geoms[invalid_idx]
+        print(f"\nInvalid polygon index: {invalid_idx}")
+        print(f"  Exterior points: {len(poly.exterior.coords)}")
+        print(f"  Number of holes: {len(poly.interiors)}")
+        print(f"  Area: {poly.area:.6f}")
+        print(f"  Validity issue: {reason}")
+
+        sharing = analyze_hole_sharing(poly)
+        if sharing:
+            print("\n  Holes sharing vertices:")
+            for h1, h2, count, points in sharing:
+                print(f"    Holes {h1} and {h2}: {count} shared point(s)")
+                if count >= 2:
+                    print("      WARNING: 2+ shared points creates disconnected interior!")
+                for pt in points[:3]:
+                    print(f"      - ({pt[0]:.6f}, {pt[1]:.6f})")
 
     return invalid_idx
 
 
-def generate_overview_figure(script_dir: Path, subject_shp, clip_shp, ioverlay_shp):
+def generate_overview_figure(
+    script_dir: Path, subject_shp, clip_shp, ioverlay_shp, validities: np.ndarray, ioverlay_valid: bool
+):
     """Generate overview comparison figure."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
 
     plot_multipolygon(axes[0], subject_shp, "Subject (input)")
     plot_multipolygon(axes[1], clip_shp, "Clip (input)")
-    plot_multipolygon(axes[2], ioverlay_shp, f"iOverlay XOR (valid={ioverlay_shp.is_valid})")
+    plot_multipolygon(axes[2], ioverlay_shp, f"iOverlay XOR (valid={ioverlay_valid})", validities=validities)
 
     fig.suptitle("XOR Operation: Inputs and iOverlay Result", fontsize=14)
     fig.tight_layout()
@@ -169,14 +272,19 @@ def generate_overview_figure(script_dir: Path, subject_shp, clip_shp, ioverlay_s
     print(f"  Saved: {script_dir / 'comparison_overview.png'}")
 
 
-def generate_comparison_figure(script_dir: Path, ioverlay_shp, shapely_result):
+def generate_comparison_figure(
+    script_dir: Path, ioverlay_shp, shapely_result, validities: np.ndarray, ioverlay_valid: bool
+):
     """Generate iOverlay vs Shapely comparison figure."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     fig, axes = plt.subplots(1, 2, figsize=(12, 6))
 
     plot_multipolygon(
         axes[0],
         ioverlay_shp,
-        f"iOverlay XOR\n{len(ioverlay_shp.geoms)} polygons, valid={ioverlay_shp.is_valid}",
+        f"iOverlay XOR\n{len(ioverlay_shp.geoms)} polygons, valid={ioverlay_valid}",
+        validities=validities,
     )
     plot_multipolygon(
         axes[1],
@@ -192,6 +300,8 @@ def generate_comparison_figure(script_dir: Path, ioverlay_shp, shapely_result):
 
 def generate_detail_figure(script_dir: Path, invalid_poly: Polygon, shapely_result):
     """Generate detailed view of invalid polygon."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
     # Plot the invalid polygon from iOverlay
@@ -214,17 +324,13 @@ def generate_detail_figure(script_dir: Path, invalid_poly: Polygon, shapely_resu
         )
 
     sharing = analyze_hole_sharing(invalid_poly)
-    for h1, h2, count, points in sharing:
-        if count >= 2:
-            for pt in points:
-                ax.plot(pt[0], pt[1], "ko", markersize=8)
-                ax.annotate(
-                    f"shared\n{h1}-{h2}",
-                    (pt[0], pt[1]),
-                    fontsize=8,
-                    xytext=(5, 5),
-                    textcoords="offset points",
-                )
+    shared_pts = [(pt, f"shared\n{h1}-{h2}") for h1, h2, count, points in sharing if count >= 2 for pt in points]
+    if shared_pts:
+        # One scatter artist for all markers; annotations are per-call by nature.
+        pts = np.asarray([pt for pt, _ in shared_pts])
+        ax.scatter(pts[:, 0], pts[:, 1], c="k", s=64)
+        for (x0, y0), (_, label) in zip(pts, shared_pts, strict=True):
+            ax.annotate(label, (x0, y0), fontsize=8, xytext=(5, 5), textcoords="offset points")
 
     ax.legend(loc="upper right", fontsize=8)
     ax.set_aspect("equal")
@@ -239,7 +345,9 @@ def generate_detail_figure(script_dir: Path, invalid_poly: Polygon, shapely_resu
 
     search_box = box(bounds[0] - padding, bounds[1] - padding, bounds[2] + padding, bounds[3] + padding)
 
-    matching_polys = [p for p in shapely_result.geoms if p.intersects(search_box)]
+    # Spatial index lookup instead of an O(N) intersects() scan over all polygons.
+    tree = shapely.STRtree(list(shapely_result.geoms))
+    matching_polys = [shapely_result.geoms[int(i)] for i in tree.query(search_box, predicate="intersects")]
     ax2.set_title(f"Shapely: Same region split into {len(matching_polys)} valid polygons")
 
     for poly in matching_polys:
@@ -286,6 +394,14 @@ polygons at the pinch points.
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="OGC validity analysis: iOverlay vs Shapely")
+    parser.add_argument(
+        "--no-plot",
+        action="store_true",
+        help="Skip figure generation and only print the numerical analysis",
+    )
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     json_path = script_dir / "fuzzer-spots-12.json"
 
@@ -314,21 +430,32 @@ def main():
     ioverlay_shp = shapes_to_shapely(ioverlay_result)
     shapely_result = subject_shp.symmetric_difference(clip_shp)
 
-    invalid_idx = print_results(ioverlay_shp, shapely_result)
+    # Validate every result polygon once; everything downstream reuses this.
+    validities = shapely.is_valid(np.asarray(ioverlay_shp.geoms))
+    # The per-polygon pass misses inter-polygon issues (e.g. overlapping
+    # parts), so check the whole geometry once as well for the reports.
+    ioverlay_valid = bool(shapely.is_valid(ioverlay_shp))
 
-    print("\n" + "-" * 70)
-    print("Generating visualizations...")
-    print("-" * 70)
+    invalid_idx = print_results(ioverlay_shp, shapely_result, validities, ioverlay_valid)
 
-    generate_overview_figure(script_dir, subject_shp, clip_shp, ioverlay_shp)
-    generate_comparison_figure(script_dir, ioverlay_shp, shapely_result)
+    if not args.no_plot:
+        print("\n" + "-" * 70)
+        print("Generating visualizations...")
+        print("-" * 70)
 
-    if invalid_idx is not None:
-        invalid_poly = ioverlay_shp.geoms[invalid_idx]
-        generate_detail_figure(script_dir, invalid_poly, shapely_result)
+        generate_overview_figure(script_dir, subject_shp, clip_shp, ioverlay_shp, validities, ioverlay_valid)
+        generate_comparison_figure(script_dir, ioverlay_shp, shapely_result, validities, ioverlay_valid)
+
+        if invalid_idx is not None:
+            invalid_poly = ioverlay_shp.geoms[invalid_idx]
+            generate_detail_figure(script_dir, invalid_poly, shapely_result)
 
     print_summary(ioverlay_shp)
-    plt.show()
+
+    if not args.no_plot:
+        import matplotlib.pyplot as plt  # noqa: PLC0415
+
+        plt.show()
 
 
 if __name__ == "__main__":
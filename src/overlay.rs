@@ -224,6 +224,18 @@ impl PyFloatOverlayGraph {
         shapes_to_python(py, &result)
     }
 
+    /// Number of subject shapes in the graph.
+    #[getter]
+    fn subject_count(&self) -> usize {
+        self.subject.len()
+    }
+
+    /// Number of clip shapes in the graph.
+    #[getter]
+    fn clip_count(&self) -> usize {
+        self.clip.len()
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "FloatOverlayGraph(subject_count={}, clip_count={}, fill_rule={:?})",
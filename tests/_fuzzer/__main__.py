@@ -11,10 +11,13 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .generators import (
     RandomCenterTargetsGenerator,
@@ -39,6 +42,12 @@ GENERATORS = {
 }
 
 
+@functools.cache
+def _get_generator(name: str) -> RandomPolyGenerator:
+    """Return the singleton generator instance for a generator name."""
+    return GENERATORS[name]()
+
+
 def reproduce_seed(
     generator_name: str,
     seed: int,
@@ -56,13 +65,12 @@ def reproduce_seed(
     Returns:
         0 if all tests pass, 1 if there are errors.
     """
-    generator_cls = GENERATORS.get(generator_name)
-    if generator_cls is None:
+    if generator_name not in GENERATORS:
         print(f"Unknown generator: {generator_name}", file=sys.stderr)
         print(f"Available: {', '.join(GENERATORS.keys())}", file=sys.stderr)
         return 1
 
-    generator = generator_cls()
+    generator = _get_generator(generator_name)
     test_case = TestCase(generator, seed)
 
     if verbose:
@@ -79,8 +87,8 @@ def reproduce_seed(
         return 0
 
     print(f"Found {len(errors)} errors:")
-    for _, row in errors.iterrows():
-        print(f"  {row['function']}: {row['error']}")
+    for row in errors.itertuples():
+        print(f"  {row.function}: {row.error}")
 
     # Save failure report JSON
     filepath = save_failure_report(generator, seed, errors, output_dir)
@@ -96,29 +104,29 @@ def reproduce_seed(
 
 def _run_full_fuzzer(args: argparse.Namespace) -> int:
     """Run full fuzzer across generators."""
+    # Instantiate every generator up-front, before any worker processes fork.
     generators_to_run = (
-        list(GENERATORS.items()) if args.generator == "all" else [(args.generator, GENERATORS[args.generator])]
+        [_get_generator(name) for name in GENERATORS] if args.generator == "all" else [_get_generator(args.generator)]
     )
 
     all_failures: list[tuple[RandomPolyGenerator, int, pd.DataFrame]] = []
 
-    for _name, generator_cls in generators_to_run:
-        generator = generator_cls()
+    for generator in generators_to_run:
         df = run_fuzzer(
             generator,
             n_procs=args.workers,
             n_tests=args.runs,
+            chunksize=args.chunksize,
             verbose=not args.quiet,
         )
 
         errors = df[df.error.notna()]
         if len(errors) > 0:
-            failing_seeds = errors["seed"].unique()
             if not args.quiet:
-                print(f"  Failing seeds: {failing_seeds}")
+                print(f"  Failing seeds: {errors['seed'].unique()}")
 
-            for seed in failing_seeds:
-                seed_errors = errors[errors["seed"] == seed]
+            # One groupby pass instead of a fresh boolean filter per seed.
+            for seed, seed_errors in errors.groupby("seed", sort=False):
                 filepath = save_failure_report(generator, seed, seed_errors, args.output_dir)
                 if not args.quiet:
                     print(f"  Saved: {filepath}")
@@ -148,6 +156,12 @@ def main() -> int:
         default=None,
         help="Number of worker processes (default: CPU count)",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Seeds dispatched per worker round-trip (default: runs / (4 * workers))",
+    )
     parser.add_argument(
         "--generator",
         type=str,
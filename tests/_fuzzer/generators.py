@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import functools
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -26,6 +27,53 @@ Shapes = list[Shape]
 
 type GenericPoly = shapely.geometry.Polygon | shapely.geometry.MultiPolygon
 
+# Shared geometry constants — built once instead of per call/seed.
+_UNIT_SQUARE = shapely.geometry.box(0.0, 0.0, 1.0, 1.0)
+_FALLBACK_SQUARE = shapely.geometry.box(0.25, 0.25, 0.75, 0.75)
+
+# Shared RNG whose state is reset per seed. Reseating PCG64 state produces a
+# stream identical to np.random.default_rng(seed) while skipping the Generator
+# allocation on every call.
+_RNG = np.random.default_rng(0)
+
+
+def _seeded_rng(seed: int) -> RngGenerator:
+    """Reset the shared module RNG to the given seed and return it."""
+    _RNG.bit_generator.state = np.random.PCG64(seed).state
+    return _RNG
+
+
+@functools.cache
+def _unit_circle(n_vertices: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get (cos, sin) tables for n_vertices evenly spaced angles in [0, 2*pi).
+
+    The tables only depend on the vertex count, so they are shared across all
+    spots/rings instead of recomputing linspace + cos + sin per circle.
+    """
+    theta = np.linspace(0, 2 * np.pi, num=n_vertices, endpoint=False)
+    return np.cos(theta), np.sin(theta)
+
+
+def _polygons_from_coords(coord_arrays: list[np.ndarray]) -> np.ndarray:
+    """Build one polygon per coordinate array with a single constructor call."""
+    coords = np.concatenate(coord_arrays)
+    indices = np.repeat(np.arange(len(coord_arrays)), [len(c) for c in coord_arrays])
+    polys: np.ndarray = shapely.polygons(shapely.linearrings(coords, indices=indices))
+    return polys
+
+
+def _valid_polygons(polys: np.ndarray) -> list[GenericPoly]:
+    """Filter a batch of polygons with one vectorized validity check.
+
+    Invalid polygons are repaired with make_valid; empty results are dropped.
+    """
+    result: list[GenericPoly] = []
+    for poly, ok in zip(polys, shapely.is_valid(polys), strict=True):
+        repaired = poly if ok else shapely.make_valid(poly)
+        if not repaired.is_empty:
+            result.append(repaired)
+    return result
+
 
 def shapely_to_shapes(geom: GenericPoly) -> Shapes:
     """Convert a shapely geometry to i_overlay Shapes format."""
@@ -39,35 +87,49 @@ def shapely_to_shapes(geom: GenericPoly) -> Shapes:
     else:
         return []
 
-    shapes: Shapes = []
+    # Collect every ring across all polygons and pull their coordinates out of
+    # GEOS in a single batched call; the index array delimits the rings.
+    ring_objs = []
+    ring_counts = []
     for poly in polys:
         if poly.is_empty:
             continue
-        shape: Shape = []
-        # Exterior ring
-        shape.append(list(poly.exterior.coords[:-1]))  # Remove closing point
-        # Interior rings (holes)
-        for interior in poly.interiors:
-            shape.append(list(interior.coords[:-1]))
-        shapes.append(shape)
+        ring_objs.append(poly.exterior)
+        ring_objs.extend(poly.interiors)
+        ring_counts.append(1 + len(poly.interiors))
+    if not ring_objs:
+        return []
+
+    coords, index = shapely.get_coordinates(ring_objs, return_index=True)
+    # Drop the closing point of each ring — i_overlay treats contours as
+    # implicitly closed.
+    rings = [list(map(tuple, ring[:-1].tolist())) for ring in np.split(coords, np.flatnonzero(np.diff(index)) + 1)]
 
+    shapes: Shapes = []
+    start = 0
+    for count in ring_counts:
+        shapes.append(rings[start : start + count])
+        start += count
     return shapes
 
 
 def clip_to_unit_square(poly: GenericPoly) -> GenericPoly:
     """Clip geometry to the unit square [0,1] x [0,1]."""
-    bbox = shapely.geometry.box(0, 0, 1, 1)
-    return poly.intersection(bbox)
+    return poly.intersection(_UNIT_SQUARE)
 
 
 def scale_geometry(poly: GenericPoly, factor: float) -> GenericPoly:
     """Scale geometry by a factor around the origin."""
-    return shapely.transform(poly, lambda pts: pts * factor)
+    coords = shapely.get_coordinates(poly)
+    coords *= factor
+    return shapely.set_coordinates(poly, coords)
 
 
 def translate_geometry(poly: GenericPoly, xoff: float, yoff: float) -> GenericPoly:
     """Translate geometry by offset."""
-    return shapely.transform(poly, lambda pts: pts + np.array([xoff, yoff]))
+    coords = shapely.get_coordinates(poly)
+    coords += (xoff, yoff)
+    return shapely.set_coordinates(poly, coords)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -96,7 +158,7 @@ class RandomPolyGenerator(abc.ABC):
         Returns:
             List of shapes in i_overlay format.
         """
-        rng = np.random.default_rng(seed)
+        rng = _seeded_rng(seed)
         poly = self._fill_unit_square(rng)
 
         if not poly.is_valid:
@@ -138,38 +200,35 @@ class RandomSpotsGenerator(RandomPolyGenerator):
         return "spots"
 
     def _fill_unit_square(self, rng: RngGenerator) -> GenericPoly:
-        polygons = []
         centers = rng.uniform(0, 1, size=(self.n_spots, 2))
         radii = rng.normal(self.mean_radius, 0.3 * self.mean_radius, size=self.n_spots)
         radii = np.clip(radii, 0.01, 0.3)  # Ensure reasonable radii
 
-        for radius, (cx, cy) in zip(radii, centers, strict=True):
-            poly = self._make_spot(rng, radius, cx, cy)
-            if poly is not None and poly.is_valid and not poly.is_empty:
-                polygons.append(poly)
+        # One fused draw for all per-spot radial noise; row-major filling makes
+        # this stream-identical to n_spots sequential per-spot draws.
+        noise = rng.uniform(-0.2, 0.2, size=(self.n_spots, self.vertices_per_spot))
+
+        # Build all spot polygons in one batched constructor call, then
+        # repair the batch with one vectorized validity pass — union_all
+        # throws on self-intersecting input, so the repair has to happen
+        # before the union, not in __call__.
+        coords = [
+            self._spot_coords(radius, cx, cy, spot_noise)
+            for radius, (cx, cy), spot_noise in zip(radii, centers, noise, strict=True)
+        ]
+        polygons = _valid_polygons(_polygons_from_coords(coords))
 
         if not polygons:
             # Fallback to a simple square
-            return shapely.geometry.box(0.25, 0.25, 0.75, 0.75)
+            return _FALLBACK_SQUARE
 
         return shapely.union_all(polygons)
 
-    def _make_spot(self, rng: RngGenerator, radius: float, cx: float, cy: float) -> GenericPoly | None:
-        """Create a slightly irregular circular spot."""
-        theta = np.linspace(0, 2 * np.pi, num=self.vertices_per_spot, endpoint=False)
-        # Add some randomness to the radius
-        radii = radius * (1 + rng.uniform(-0.2, 0.2, size=self.vertices_per_spot))
-        x = cx + radii * np.cos(theta)
-        y = cy + radii * np.sin(theta)
-        coords = list(zip(x, y, strict=True))
-
-        try:
-            poly = shapely.geometry.Polygon(coords)
-            if poly.is_valid:
-                return poly
-            return shapely.make_valid(poly)
-        except Exception:
-            return None
+    def _spot_coords(self, radius: float, cx: float, cy: float, noise: np.ndarray) -> np.ndarray:
+        """Coordinates of a slightly irregular circular spot."""
+        cos_t, sin_t = _unit_circle(self.vertices_per_spot)
+        radii = radius * (1 + noise)
+        return np.column_stack((cx + radii * cos_t, cy + radii * sin_t))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -189,45 +248,48 @@ class RandomCenterTargetsGenerator(RandomPolyGenerator):
         return "center_targets"
 
     def _fill_unit_square(self, rng: RngGenerator) -> GenericPoly:
-        polygons = []
         cx, cy = 0.5 + rng.uniform(-0.2, 0.2, size=2)
 
+        outer_radii = []
         radius = 0.45
         while radius > 2 * self.radius_step:
-            ring = self._make_ring(radius, cx, cy)
-            if ring is not None and ring.is_valid and not ring.is_empty:
-                polygons.append(ring)
+            outer_radii.append(radius)
             radius -= self.radius_step * 1.5
 
+        polygons = self._make_rings(outer_radii, cx, cy)
         if not polygons:
-            return shapely.geometry.box(0.25, 0.25, 0.75, 0.75)
+            return _FALLBACK_SQUARE
 
+        # Concentric rings are pairwise disjoint by construction (the radial
+        # gap between consecutive rings is positive), so no union is needed.
+        if all(isinstance(p, shapely.geometry.Polygon) for p in polygons):
+            return shapely.geometry.MultiPolygon(polygons)
         return shapely.union_all(polygons)
 
-    def _make_ring(self, radius: float, cx: float, cy: float) -> GenericPoly | None:
-        """Create a ring at the given radius."""
-        outer = self._make_circle(radius, cx, cy)
-        inner_radius = radius - self.ring_width
-        if inner_radius <= 0:
-            return outer
-        inner = self._make_circle(inner_radius, cx, cy)
-
-        try:
-            ring = outer.difference(inner)
-            if ring.is_valid:
-                return ring
-            return shapely.make_valid(ring)
-        except Exception:
-            return outer
-
-    def _make_circle(self, radius: float, cx: float, cy: float) -> GenericPoly:
-        """Create a circle with vertices based on arc length."""
+    def _make_rings(self, outer_radii: list[float], cx: float, cy: float) -> list[GenericPoly]:
+        """Create all rings, building every circle in one batched call."""
+        if not outer_radii:
+            return []
+        ring_radii = [(r, r - self.ring_width) for r in outer_radii]
+        coords = [self._circle_coords(r, cx, cy) for pair in ring_radii for r in pair if r > 0]
+        circles = iter(_polygons_from_coords(coords))
+
+        # The circles are simple by construction and GEOS difference of valid
+        # inputs is valid, so only emptiness needs checking.
+        rings: list[GenericPoly] = []
+        for _outer_radius, inner_radius in ring_radii:
+            outer = next(circles)
+            ring = outer if inner_radius <= 0 else outer.difference(next(circles))
+            if not ring.is_empty:
+                rings.append(ring)
+        return rings
+
+    def _circle_coords(self, radius: float, cx: float, cy: float) -> np.ndarray:
+        """Coordinates of a circle with vertices based on arc length."""
         delta_theta = self.min_arc_length / max(radius, 0.01)
         n_steps = max(8, int(np.round(2 * np.pi / delta_theta)))
-        theta = np.linspace(0, 2 * np.pi, num=n_steps, endpoint=False)
-        x = cx + radius * np.cos(theta)
-        y = cy + radius * np.sin(theta)
-        return shapely.geometry.Polygon(zip(x, y, strict=True))
+        cos_t, sin_t = _unit_circle(n_steps)
+        return np.column_stack((cx + radius * cos_t, cy + radius * sin_t))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -248,46 +310,58 @@ class RandomRadiusTargetsGenerator(RandomPolyGenerator):
         return "radius_targets"
 
     def _fill_unit_square(self, rng: RngGenerator) -> GenericPoly:
-        polygons = []
+        outer_radii = []
         radius = 0.45
-
         while radius > 2 * self.radius_step:
-            ring = self._make_ring(rng, radius)
-            if ring is not None and ring.is_valid and not ring.is_empty:
-                polygons.append(ring)
+            outer_radii.append(radius)
             radius -= self.radius_step * 1.5
 
+        polygons = self._make_rings(rng, outer_radii)
         if not polygons:
-            return shapely.geometry.box(0.25, 0.25, 0.75, 0.75)
+            return _FALLBACK_SQUARE
 
+        # The radial gap between consecutive rings (0.035) exceeds twice the
+        # radius noise, so the rings are pairwise disjoint and no union is
+        # needed.
+        if all(isinstance(p, shapely.geometry.Polygon) for p in polygons):
+            return shapely.geometry.MultiPolygon(polygons)
         return shapely.union_all(polygons)
 
-    def _make_ring(self, rng: RngGenerator, radius: float) -> GenericPoly | None:
-        """Create a ring with randomized radius."""
-        outer = self._make_circle(rng, radius)
-        inner_radius = radius - self.ring_width
-        if inner_radius <= 0:
-            return outer
-        inner = self._make_circle(rng, inner_radius)
-
-        try:
-            ring = outer.difference(inner)
-            if ring.is_valid:
-                return ring
-            return shapely.make_valid(ring)
-        except Exception:
-            return outer
-
-    def _make_circle(self, rng: RngGenerator, radius: float) -> GenericPoly:
-        """Create a circle with random radius perturbations."""
+    def _make_rings(self, rng: RngGenerator, outer_radii: list[float]) -> list[GenericPoly]:
+        """Create all rings, building every circle in one batched call."""
+        if not outer_radii:
+            return []
+        ring_radii = [(r, r - self.ring_width) for r in outer_radii]
+        # Circle sizes are deterministic, so all radial noise can be drawn in
+        # one fused call — stream-identical to sequential per-circle draws in
+        # outer-then-inner order.
+        circle_radii = [r for pair in ring_radii for r in pair if r > 0]
+        steps = [self._n_steps(r) for r in circle_radii]
+        noise = rng.uniform(-self.radius_noise, self.radius_noise, size=sum(steps))
+        noise_chunks = np.split(noise, np.cumsum(steps)[:-1])
+        coords = [self._circle_coords(r, chunk) for r, chunk in zip(circle_radii, noise_chunks, strict=True)]
+        circles = iter(_polygons_from_coords(coords))
+
+        # The circles are simple by construction and GEOS difference of valid
+        # inputs is valid, so only emptiness needs checking.
+        rings: list[GenericPoly] = []
+        for _outer_radius, inner_radius in ring_radii:
+            outer = next(circles)
+            ring = outer if inner_radius <= 0 else outer.difference(next(circles))
+            if not ring.is_empty:
+                rings.append(ring)
+        return rings
+
+    def _n_steps(self, radius: float) -> int:
+        """Number of circle vertices needed to respect min_arc_length."""
         delta_theta = self.min_arc_length / max(radius, 0.01)
-        n_steps = max(8, int(np.round(2 * np.pi / delta_theta)))
-        theta = np.linspace(0, 2 * np.pi, num=n_steps, endpoint=False)
-        # Add noise to radius
-        radii = radius + rng.uniform(-self.radius_noise, self.radius_noise, size=n_steps)
-        x = 0.5 + radii * np.cos(theta)
-        y = 0.5 + radii * np.sin(theta)
-        return shapely.geometry.Polygon(zip(x, y, strict=True))
+        return max(8, int(np.round(2 * np.pi / delta_theta)))
+
+    def _circle_coords(self, radius: float, noise: np.ndarray) -> np.ndarray:
+        """Coordinates of a circle with the given radius perturbations."""
+        cos_t, sin_t = _unit_circle(len(noise))
+        radii = radius + noise
+        return np.column_stack((0.5 + radii * cos_t, 0.5 + radii * sin_t))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -307,20 +381,20 @@ class RandomPolygonsGenerator(RandomPolyGenerator):
         return "random_polygons"
 
     def _fill_unit_square(self, rng: RngGenerator) -> GenericPoly:
-        polygons = []
-
-        for _ in range(self.n_polygons):
-            poly = self._make_random_polygon(rng)
-            if poly is not None and poly.is_valid and not poly.is_empty:
-                polygons.append(poly)
+        # Build all polygons in one batched constructor call, then repair
+        # the batch with one vectorized validity pass. Sorted angles do not
+        # guarantee simplicity (near-duplicate angles still produce the odd
+        # self-intersecting ring), and union_all throws on invalid input.
+        coords = [self._random_polygon_coords(rng) for _ in range(self.n_polygons)]
+        polygons = _valid_polygons(_polygons_from_coords(coords))
 
         if not polygons:
-            return shapely.geometry.box(0.25, 0.25, 0.75, 0.75)
+            return _FALLBACK_SQUARE
 
         return shapely.union_all(polygons)
 
-    def _make_random_polygon(self, rng: RngGenerator) -> GenericPoly | None:
-        """Create a random polygon using convex hull of random points."""
+    def _random_polygon_coords(self, rng: RngGenerator) -> np.ndarray:
+        """Coordinates of a random star-shaped polygon."""
         n_vertices = rng.integers(self.min_vertices, self.max_vertices + 1)
 
         # Generate random center and size
@@ -331,14 +405,4 @@ class RandomPolygonsGenerator(RandomPolyGenerator):
         angles = np.sort(rng.uniform(0, 2 * np.pi, size=n_vertices))
         radii = size * (0.5 + 0.5 * rng.uniform(0, 1, size=n_vertices))
 
-        x = cx + radii * np.cos(angles)
-        y = cy + radii * np.sin(angles)
-        coords = list(zip(x, y, strict=True))
-
-        try:
-            poly = shapely.geometry.Polygon(coords)
-            if poly.is_valid:
-                return poly
-            return shapely.make_valid(poly)
-        except Exception:
-            return None
+        return np.column_stack((cx + radii * np.cos(angles), cy + radii * np.sin(angles)))
@@ -8,14 +8,15 @@ from __future__ import annotations
 
 import concurrent.futures
 import dataclasses
+import functools
 import json
 import os
 from pathlib import Path
-import re
 import subprocess
 import time
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 import shapely
 import shapely.geometry
@@ -39,36 +40,71 @@ Contour = list[Point]
 Shape = list[Contour]
 Shapes = list[Shape]
 
+_OVERLAY_RULES = (OverlayRule.Union, OverlayRule.Intersect, OverlayRule.Difference, OverlayRule.Xor)
+_FILL_RULES = (FillRule.EvenOdd, FillRule.NonZero, FillRule.Positive, FillRule.Negative)
 
-def _close_ring(ring: Contour) -> Contour:
-    """Close a ring if not already closed."""
-    if ring[0] != ring[-1]:
-        return [*ring, ring[0]]
-    return ring
-
-
-def _convert_shape_to_polygon(shape: Shape) -> shapely.geometry.Polygon | None:
-    """Convert a single shape to a shapely Polygon."""
-    if not shape:
-        return None
-    exterior = shape[0]
-    if len(exterior) < 3:
-        return None
-    exterior = _close_ring(exterior)
-    holes = [_close_ring(hole) for hole in shape[1:] if len(hole) >= 3]
-    try:
-        poly = shapely.geometry.Polygon(exterior, holes or None)
-        return poly if not poly.is_empty else None
-    except Exception:
-        return None
+# Function names for time_all rows, built once at import time instead of
+# re-evaluating an f-string (and the enum __str__) per row per seed.
+_OVERLAY_FUNC_NAMES = {(o, f): f"overlay_{o}_{f}" for o in _OVERLAY_RULES for f in _FILL_RULES}
+_GRAPH_BUILD_NAMES = {f: f"graph_build_{f}" for f in _FILL_RULES}
+_GRAPH_EXTRACT_NAMES = {(o, f): f"graph_extract_{o}_{f}" for o in _OVERLAY_RULES for f in _FILL_RULES}
 
 
 def shapes_to_shapely(shapes: Shapes) -> shapely.geometry.MultiPolygon:
-    """Convert i_overlay Shapes to shapely MultiPolygon."""
-    polygons = [poly for shape in shapes if (poly := _convert_shape_to_polygon(shape)) is not None]
-    if not polygons:
+    """Convert i_overlay Shapes to shapely MultiPolygon.
+
+    The nested Python lists are flattened into one contiguous float64
+    coordinate buffer and every ring/polygon is built with a single batched
+    constructor call, instead of allocating per-shape Python objects.
+    """
+    rings: list[np.ndarray] = []
+    owners: list[int] = []
+    n_polys = 0
+    for shape in shapes:
+        if not shape or len(shape[0]) < 3:
+            continue
+        rings.append(np.asarray(shape[0], dtype=np.float64))
+        owners.append(n_polys)
+        for hole in shape[1:]:
+            if len(hole) >= 3:
+                rings.append(np.asarray(hole, dtype=np.float64))
+                owners.append(n_polys)
+        n_polys += 1
+    if not n_polys:
         return shapely.geometry.MultiPolygon()
-    return shapely.geometry.MultiPolygon(polygons)
+
+    # linearrings closes each ring automatically when first != last.
+    coords = np.concatenate(rings)
+    indices = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+    ring_geoms = shapely.linearrings(coords, indices=indices)
+
+    owner_ids = np.asarray(owners)
+    is_exterior = np.r_[True, owner_ids[1:] != owner_ids[:-1]]
+    exteriors = ring_geoms[is_exterior]
+    hole_owners = owner_ids[~is_exterior]
+    hole_counts = np.bincount(hole_owners, minlength=n_polys)
+    if hole_counts.any():
+        holes = np.full((n_polys, hole_counts.max()), None, dtype=object)
+        cols = np.arange(hole_owners.size) - np.r_[0, np.cumsum(hole_counts)[:-1]][hole_owners]
+        holes[hole_owners, cols] = ring_geoms[~is_exterior]
+        polys = shapely.polygons(exteriors, holes=holes)
+    else:
+        polys = shapely.polygons(exteriors)
+
+    polys = polys[~shapely.is_empty(polys)]
+    return shapely.geometry.MultiPolygon(polys.tolist())
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_case_shapes(generator: RandomPolyGenerator, seed: int) -> tuple[Shapes, Shapes]:
+    """Generate (subject, clip) shapes for a seed, memoized per process.
+
+    A seed fully determines the generator output, and failure reporting
+    re-creates the same ``TestCase`` that already ran, so caching here
+    removes a duplicate (potentially expensive) generation pass. The
+    generators are frozen dataclasses and therefore hashable cache keys.
+    """
+    return generator(seed), generator(seed + 1_000_000_000)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -86,8 +122,9 @@ class TestCase:
 
     def __post_init__(self) -> None:
         # Use seed for subject, seed + large offset for clip
-        object.__setattr__(self, "subject", self.generator(self.seed))
-        object.__setattr__(self, "clip", self.generator(self.seed + 1_000_000_000))
+        subject, clip = _generate_case_shapes(self.generator, self.seed)
+        object.__setattr__(self, "subject", subject)
+        object.__setattr__(self, "clip", clip)
 
     def _validate_result(self, result: Shapes) -> str | None:
         """Validate the result and return error message if invalid."""
@@ -154,104 +191,95 @@ class TestCase:
 
     def time_all(self) -> pd.DataFrame:
         """Run all test methods and collect timing and error information."""
-        overlay_rules = [
-            OverlayRule.Union,
-            OverlayRule.Intersect,
-            OverlayRule.Difference,
-            OverlayRule.Xor,
-        ]
-        fill_rules = [
-            FillRule.EvenOdd,
-            FillRule.NonZero,
-            FillRule.Positive,
-            FillRule.Negative,
-        ]
-
-        results = []
+        overlay_rules = _OVERLAY_RULES
+        fill_rules = _FILL_RULES
+
+        # Preallocate the result columns; the frame is built once at the end
+        # from typed arrays, bypassing pandas' per-dict type inference.
+        n = len(overlay_rules) * len(fill_rules) + len(fill_rules) * (1 + len(overlay_rules))
+        names: list[str] = [""] * n
+        errors: list[str | None] = [None] * n
+        times = np.empty(n, dtype=np.int64)
+        i = 0
 
         # Test direct overlay calls
         for overlay_rule in overlay_rules:
             for fill_rule in fill_rules:
-                func_name = f"overlay_{overlay_rule}_{fill_rule}"
-                t0 = time.monotonic()
-                try:
-                    _result, error = self._run_overlay(overlay_rule, fill_rule)
-                except Exception as e:
-                    error = f"{type(e).__name__}: {e}"
-                elapsed = time.monotonic() - t0
-
-                results.append(
-                    {
-                        "generator": self.generator.name(),
-                        "seed": self.seed,
-                        "function": func_name,
-                        "error": error,
-                        "time_ms": 1000 * elapsed,
-                    }
-                )
+                # _run_overlay already catches everything and reports it as an
+                # error string, so no try/except is needed here.
+                t0 = time.perf_counter_ns()
+                _result, error = self._run_overlay(overlay_rule, fill_rule)
+                times[i] = time.perf_counter_ns() - t0
+                names[i] = _OVERLAY_FUNC_NAMES[overlay_rule, fill_rule]
+                errors[i] = error
+                i += 1
 
         # Test FloatOverlayGraph
         for fill_rule in fill_rules:
             # Build graph
-            graph_func = f"graph_build_{fill_rule}"
-            t0 = time.monotonic()
+            t0 = time.perf_counter_ns()
             graph = None
             graph_error = None
             try:
                 graph = FloatOverlayGraph(self.subject, self.clip, fill_rule)
             except Exception as e:
                 graph_error = f"{type(e).__name__}: {e}"
-            elapsed = time.monotonic() - t0
-
-            results.append(
-                {
-                    "generator": self.generator.name(),
-                    "seed": self.seed,
-                    "function": graph_func,
-                    "error": graph_error,
-                    "time_ms": 1000 * elapsed,
-                }
-            )
+            times[i] = time.perf_counter_ns() - t0
+            names[i] = _GRAPH_BUILD_NAMES[fill_rule]
+            errors[i] = graph_error
+            i += 1
 
             # Extract from graph
             if graph is not None:
                 for overlay_rule in overlay_rules:
-                    extract_func = f"graph_extract_{overlay_rule}_{fill_rule}"
-                    t0 = time.monotonic()
-                    try:
-                        _, error = self._run_graph_extract(graph, overlay_rule)
-                    except Exception as e:
-                        error = f"{type(e).__name__}: {e}"
-                    elapsed = time.monotonic() - t0
-
-                    results.append(
-                        {
-                            "generator": self.generator.name(),
-                            "seed": self.seed,
-                            "function": extract_func,
-                            "error": error,
-                            "time_ms": 1000 * elapsed,
-                        }
-                    )
-
-        return pd.DataFrame(results)
+                    t0 = time.perf_counter_ns()
+                    _, error = self._run_graph_extract(graph, overlay_rule)
+                    times[i] = time.perf_counter_ns() - t0
+                    names[i] = _GRAPH_EXTRACT_NAMES[overlay_rule, fill_rule]
+                    errors[i] = error
+                    i += 1
+
+        # Rows may be unused if a graph build failed; trim to what was run.
+        return pd.DataFrame(
+            {
+                "generator": self.generator.name(),
+                "seed": self.seed,
+                "function": names[:i],
+                "error": errors[:i],
+                "time_ms": times[:i] / 1e6,
+            }
+        )
 
 
-@dataclasses.dataclass(frozen=True)
-class FuzzRunner:
-    """Runs fuzz tests for a generator."""
+# Generator instance held per worker process, set once by the pool initializer
+# so each task only ships an integer seed instead of a pickled generator.
+_worker_generator: RandomPolyGenerator | None = None
+
+
+def _worker_init(generator: RandomPolyGenerator) -> None:
+    """Store the generator in a worker-process global."""
+    global _worker_generator  # noqa: PLW0603
+    _worker_generator = generator
+
+
+def _worker(seed: int) -> pd.DataFrame:
+    """Run all tests for a single seed using the worker's generator."""
+    assert _worker_generator is not None, "worker pool was not initialized"
+    return TestCase(_worker_generator, seed).time_all()
 
-    generator: RandomPolyGenerator
 
-    def __call__(self, seed: int) -> pd.DataFrame:
-        """Run all tests for a single seed."""
-        return TestCase(self.generator, seed).time_all()
+def _worker_task(task: tuple[RandomPolyGenerator, int]) -> pd.DataFrame:
+    """Run all tests for a (generator, seed) task on a shared, uninitialized pool."""
+    generator, seed = task
+    return TestCase(generator, seed).time_all()
 
 
 def run_fuzzer(
     generator: RandomPolyGenerator,
     n_procs: int | None = None,
     n_tests: int | None = None,
+    chunksize: int | None = None,
+    executor: concurrent.futures.Executor | None = None,
     verbose: bool = True,
 ) -> pd.DataFrame:
     """Run the fuzzer with multiple processes.
@@ -260,6 +288,11 @@ def run_fuzzer(
         generator: The polygon generator to use.
         n_procs: Number of processes (default: CPU count).
         n_tests: Number of test iterations (default: 10 * CPU count).
+        chunksize: Seeds dispatched per IPC round-trip (default: n_tests / (4 * n_procs)).
+        executor: Externally managed pool shared across calls. Tasks then
+            carry the generator alongside each seed, since a shared pool
+            cannot be specialized with a per-generator initializer. When
+            None, a dedicated pool is spawned for this run.
         verbose: Whether to print progress.
 
     Returns:
@@ -269,15 +302,26 @@ def run_fuzzer(
         n_procs = os.cpu_count() or 1
     if n_tests is None:
         n_tests = 10 * n_procs
+    if chunksize is None:
+        # Batch seeds so each worker gets ~4 chunks, amortizing pickling/pipe
+        # overhead without losing too much load balancing.
+        chunksize = max(1, n_tests // (n_procs * 4))
 
     if verbose:
         print(f"Running fuzzer: generator={generator.name()}, procs={n_procs}, tests={n_tests}")
 
-    runner = FuzzRunner(generator)
     t0 = time.monotonic()
 
-    with concurrent.futures.ProcessPoolExecutor(max_workers=min(n_procs, n_tests)) as pool:
-        dfs = list(pool.map(runner, range(n_tests)))
+    if executor is not None:
+        tasks = ((generator, seed) for seed in range(n_tests))
+        dfs = list(executor.map(_worker_task, tasks, chunksize=chunksize))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(n_procs, n_tests),
+            initializer=_worker_init,
+            initargs=(generator,),
+        ) as pool:
+            dfs = list(pool.map(_worker, range(n_tests), chunksize=chunksize))
 
     elapsed = time.monotonic() - t0
     df = pd.concat(dfs, ignore_index=True)
@@ -315,16 +359,16 @@ def save_failure_report(
 
     # Collect failing results
     failing_results: dict[str, Shapes] = {}
-    for _, row in error_df.iterrows():
-        func_name = row["function"]
+    # Only the function names are needed; iterrows would box every row into
+    # a Series just to read one column.
+    for func_name in error_df["function"].to_numpy():
         # Parse overlay_rule and fill_rule from function name
         # Format: "overlay_OverlayRule.{rule}_FillRule.{rule}" or "graph_extract_..."
-        if func_name.startswith("overlay_") or func_name.startswith("graph_extract_"):
-            # Extract OverlayRule.X and FillRule.Y from the function name
-            match = re.search(r"OverlayRule\.(\w+)_FillRule\.(\w+)", func_name)
-            if match:
-                overlay_name = match.group(1)
-                fill_name = match.group(2)
+        if func_name.startswith(("overlay_", "graph_extract_")):
+            # The names are built from the enum reprs by time_all, so the
+            # parse is deterministic — a plain split beats a regex here.
+            overlay_name, sep, fill_name = func_name.split("OverlayRule.", 1)[-1].partition("_FillRule.")
+            if sep:
                 try:
                     overlay_rule = getattr(OverlayRule, overlay_name)
                     fill_rule = getattr(FillRule, fill_name)
@@ -346,8 +390,9 @@ def save_failure_report(
     }
 
     filepath = output_dir / f"fuzzer-{generator.name()}-{seed}.json"
-    with open(filepath, "w") as f:
-        json.dump(report, f, indent=2, default=str)  # default=str for any non-serializable types
+    # Serialize to one string and write it in a single call; json.dump writes
+    # the file in many small chunks, which dominates for big coordinate lists.
+    filepath.write_text(json.dumps(report, indent=2, default=str))  # default=str for any non-serializable types
 
     return filepath
 
@@ -415,15 +460,16 @@ def test_rust_implementation(json_path: Path) -> tuple[bool, str]:
         return False, "Binary not found. Run: cargo build --bin test_fuzzer_failure"
 
     try:
+        # Interleave stderr into stdout so callers get one combined stream;
+        # the CLI echoes it on success as well as failure.
         result = subprocess.run(
             [str(binary), str(json_path)],
             check=False,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             timeout=60,
         )
-        output = result.stdout + result.stderr
-        return result.returncode == 0, output
+        return result.returncode == 0, result.stdout.decode("utf-8", errors="replace")
     except subprocess.TimeoutExpired:
         return False, "Test timed out after 60 seconds"
     except Exception as e:
@@ -1,6 +1,26 @@
 """Pytest configuration and fixtures for i_overlay tests."""
 
+# Eagerly import the heavy extension modules (the Rust binding and GEOS
+# via shapely). pytest imports conftest before collection, so the one-off
+# initialization cost is paid here rather than inside the first test
+# module that happens to import them.
 import pytest
+import shapely
+import shapely.validation  # noqa: F401
+
+import i_overlay  # noqa: F401
+from i_overlay import FillRule, OverlayRule, overlay
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_overlay() -> None:
+    """Run one throw-away overlay before any test.
+
+    The first call into the Rust extension pays one-time setup (thread
+    pool, allocators); doing it here keeps that cost out of whichever
+    test happens to run first.
+    """
+    overlay([[[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]]], [], OverlayRule.Union, FillRule.EvenOdd)
 
 
 @pytest.fixture
@@ -1,5 +1,8 @@
 """Utilities for converting between Shapely and i_overlay types."""
 
+import functools
+
+import numpy as np
 import shapely
 from shapely.geometry.base import BaseGeometry
 
@@ -23,19 +26,14 @@ def polygon_to_shape(polygon: shapely.Polygon) -> Shape:
     if polygon.is_empty:
         return []
 
-    # Exterior ring - Shapely returns coords as (x, y) tuples
+    # Pull all ring coordinates out of GEOS in one batched call; the index
+    # array delimits the rings (exterior first, then holes).
     # Note: Shapely closes polygons by repeating the first point, but
     # i_overlay doesn't require this (it treats paths as implicitly closed).
     # We exclude the last point which is a repeat of the first.
-    exterior_coords = list(polygon.exterior.coords)[:-1]
-    shape: Shape = [[(x, y) for x, y in exterior_coords]]
-
-    # Interior rings (holes)
-    for interior in polygon.interiors:
-        hole_coords = list(interior.coords)[:-1]
-        shape.append([(x, y) for x, y in hole_coords])
-
-    return shape
+    rings = [polygon.exterior, *polygon.interiors]
+    coords, index = shapely.get_coordinates(rings, return_index=True)
+    return [list(map(tuple, ring[:-1].tolist())) for ring in np.split(coords, np.flatnonzero(np.diff(index)) + 1)]
 
 
 def geometry_to_shapes(geom: BaseGeometry) -> Shapes:
@@ -66,6 +64,27 @@ def geometry_to_shapes(geom: BaseGeometry) -> Shapes:
     raise TypeError(msg)
 
 
+@functools.lru_cache(maxsize=16)
+def _geometry_to_shapes_cached(wkb: bytes) -> Shapes:
+    return geometry_to_shapes(shapely.from_wkb(wkb))
+
+
+def geometry_to_shapes_cached(geom: BaseGeometry) -> Shapes:
+    """Convert a Shapely geometry to i_overlay shapes, memoized by WKB.
+
+    Useful for fixed test geometries that are converted repeatedly; the WKB
+    bytes act as a hashable cache key. Treat the result as read-only — it is
+    shared between callers.
+
+    Args:
+        geom: A Shapely geometry (Polygon or MultiPolygon).
+
+    Returns:
+        Shapes as list[list[list[tuple[float, float]]]].
+    """
+    return _geometry_to_shapes_cached(shapely.to_wkb(geom))
+
+
 def shapes_to_multipolygon(shapes: Shapes) -> shapely.MultiPolygon:
     """Convert i_overlay shapes to a Shapely MultiPolygon.
 
@@ -75,17 +94,139 @@ def shapes_to_multipolygon(shapes: Shapes) -> shapely.MultiPolygon:
     Returns:
         A Shapely MultiPolygon.
     """
-    polygons = []
+    if not shapes:
+        return shapely.MultiPolygon()
+
+    # Fast path for the common "simple rings, no holes" case (e.g. outline
+    # results): build all polygons with one vectorized constructor call.
+    n_vertices = len(shapes[0][0]) if shapes[0] else 0
+    if n_vertices >= 3 and all(len(shape) == 1 and len(shape[0]) == n_vertices for shape in shapes):
+        polys = shapely.polygons(np.asarray([shape[0] for shape in shapes], dtype=np.float64))
+        keep = shapely.is_valid(polys) & ~shapely.is_empty(polys)
+        return shapely.MultiPolygon(list(polys[keep]))
+
+    # General path: batch every ring through the vectorized shapely
+    # constructors (linearrings closes each ring automatically), grouping
+    # holes to their owning polygon via an object matrix.
+    rings: list[np.ndarray] = []
+    owners: list[int] = []
+    n_polys = 0
     for shape in shapes:
-        if not shape:
+        if not shape or len(shape[0]) < 3:
             continue
-        exterior = shape[0]
-        holes = shape[1:] if len(shape) > 1 else None
-        polygon = shapely.Polygon(exterior, holes)
-        if polygon.is_valid and not polygon.is_empty:
-            polygons.append(polygon)
+        rings.append(np.asarray(shape[0], dtype=np.float64))
+        owners.append(n_polys)
+        for hole in shape[1:]:
+            if len(hole) >= 3:
+                rings.append(np.asarray(hole, dtype=np.float64))
+                owners.append(n_polys)
+        n_polys += 1
+    if not n_polys:
+        return shapely.MultiPolygon()
+
+    coords = np.concatenate(rings)
+    indices = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+    ring_geoms = shapely.linearrings(coords, indices=indices)
+
+    owner_ids = np.asarray(owners)
+    is_exterior = np.r_[True, owner_ids[1:] != owner_ids[:-1]]
+    exteriors = ring_geoms[is_exterior]
+    hole_owners = owner_ids[~is_exterior]
+    hole_counts = np.bincount(hole_owners, minlength=n_polys)
+    if hole_counts.any():
+        holes = np.full((n_polys, hole_counts.max()), None, dtype=object)
+        cols = np.arange(hole_owners.size) - np.r_[0, np.cumsum(hole_counts)[:-1]][hole_owners]
+        holes[hole_owners, cols] = ring_geoms[~is_exterior]
+        all_polys = shapely.polygons(exteriors, holes=holes)
+    else:
+        all_polys = shapely.polygons(exteriors)
+
+    keep = shapely.is_valid(all_polys) & ~shapely.is_empty(all_polys)
+    return shapely.MultiPolygon(list(all_polys[keep]))
+
+
+def _as_multipolygon(geom: BaseGeometry) -> BaseGeometry:
+    """Promote a bare Polygon to a MultiPolygon; pass anything else through."""
+    if isinstance(geom, shapely.Polygon):
+        return shapely.MultiPolygon() if geom.is_empty else shapely.MultiPolygon([geom])
+    return geom
+
+
+def assert_geom_equal(a: BaseGeometry, b: BaseGeometry, tolerance: float = 1e-9) -> None:
+    """Assert that two geometries are equal after normalization.
 
-    return shapely.MultiPolygon(polygons)
+    Normalizes both sides and compares coordinates with equals_exact,
+    which is far cheaper than the full DE-9IM equals predicate. Unlike
+    equals, equals_exact is type-sensitive, so a bare Polygon on either
+    side is promoted to a single-part MultiPolygon first — results from
+    shapes_to_multipolygon are routinely compared against plain Polygon
+    expecteds. Only suitable when both sides are expected to carry the
+    same vertex set; keep .equals where representations may legitimately
+    differ.
+
+    Args:
+        a: First geometry.
+        b: Second geometry.
+        tolerance: Absolute per-coordinate tolerance.
+    """
+    lhs = shapely.normalize(_as_multipolygon(a))
+    rhs = shapely.normalize(_as_multipolygon(b))
+    equal = shapely.equals_exact(lhs, rhs, tolerance=tolerance)
+    assert equal, f"{a.wkt=} != {b.wkt=}"
+
+
+def _canonical_ring(contour: Contour) -> np.ndarray:
+    """Return a contour as a coordinate array in canonical form.
+
+    Canonical means counter-clockwise orientation (by signed area) and
+    rotated so the ring starts at its lexicographically smallest point.
+    """
+    coords = np.asarray(contour, dtype=np.float64)
+    x, y = coords[:, 0], coords[:, 1]
+    signed_area = np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))
+    if signed_area < 0:
+        coords = coords[::-1]
+    start = np.lexsort((coords[:, 1], coords[:, 0]))[0]
+    return np.roll(coords, -start, axis=0)
+
+
+def assert_shapes_equal(result: Shapes, expected: Shapes, tol: float = 1e-9) -> None:
+    """Assert that two shapes in i_overlay format describe the same polygons.
+
+    Compares canonicalized contour coordinate arrays directly, so no GEOS
+    geometry is built and no topological equals predicate runs. Only
+    suitable when both sides are expected to use the same vertex set (no
+    collinear-point or ring-splitting differences), e.g. axis-aligned
+    rectangle results; use shapes_to_multipolygon + equals when topology
+    matters.
+
+    Args:
+        result: Shapes returned by an i_overlay operation.
+        expected: Expected shapes in the same format.
+        tol: Absolute per-coordinate tolerance.
+    """
+    assert len(result) == len(expected), f"{len(result)=} != {len(expected)=}"
+    for shape_result, shape_expected in zip(result, expected, strict=True):
+        assert len(shape_result) == len(shape_expected), f"{shape_result=} != {shape_expected=}"
+        for ring_result, ring_expected in zip(shape_result, shape_expected, strict=True):
+            assert len(ring_result) == len(ring_expected), f"{ring_result=} != {ring_expected=}"
+            np.testing.assert_allclose(_canonical_ring(ring_result), _canonical_ring(ring_expected), atol=tol)
+
+
+def multipolygon_from_rings(rings: list[Contour]) -> shapely.MultiPolygon:
+    """Build a MultiPolygon of hole-free polygons in one batched call.
+
+    shapely.polygons constructs all rings and polygons in a single
+    vectorized C call instead of one Polygon allocation per ring.
+
+    Args:
+        rings: One exterior ring per polygon; all rings must have the
+            same number of points (they are closed automatically).
+
+    Returns:
+        A MultiPolygon with one polygon per ring.
+    """
+    return shapely.multipolygons(shapely.polygons(np.asarray(rings, dtype=np.float64)))
 
 
 def box(minx: float, miny: float, maxx: float, maxy: float) -> Shapes:
@@ -100,7 +241,9 @@ def box(minx: float, miny: float, maxx: float, maxy: float) -> Shapes:
     Returns:
         Shapes containing a single rectangular shape.
     """
-    return geometry_to_shapes(shapely.box(minx, miny, maxx, maxy))
+    # Written directly in i_overlay format (same ring order shapely.box
+    # produces, minus the closing point) — no GEOS round-trip needed.
+    return [[[(maxx, miny), (maxx, maxy), (minx, maxy), (minx, miny)]]]
 
 
 def circle(x: float, y: float, radius: float, resolution: int = 32) -> Shapes:
@@ -1,5 +1,7 @@
 """Tests for clip_by function."""
 
+import numpy as np
+import pytest
 import shapely
 
 from i_overlay import (
@@ -9,49 +11,53 @@ from i_overlay import (
     clip_by,
 )
 
-from .shapely_utils import box, geometry_to_shapes
+from .shapely_utils import Shapes, geometry_to_shapes
+
+
+@pytest.fixture(scope="module")
+def square_shapes() -> Shapes:
+    """The 2x2 clip square used by most tests, written directly in i_overlay format.
+
+    clip_by only needs the shapes representation, so there is no reason to
+    round-trip the square through shapely.box + geometry_to_shapes.
+    """
+    return [[[(2.0, 0.0), (2.0, 2.0), (0.0, 2.0), (0.0, 0.0)]]]
 
 
 class TestClipBasic:
     """Basic tests for clip_by function."""
 
-    def test_clip_line_through_square(self) -> None:
+    def test_clip_line_through_square(self, square_shapes: Shapes) -> None:
         """Test clipping a line that passes through a square."""
-        # A square
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A horizontal line passing through the square
         polylines = [[(-1.0, 1.0), (3.0, 1.0)]]
 
-        result = clip_by(polylines, shapes, FillRule.EvenOdd, ClipRule())
+        result = clip_by(polylines, square_shapes, FillRule.EvenOdd, ClipRule())
 
         # Should produce one segment inside the square
         assert len(result) == 1
-        # The clipped segment should be from (0, 1) to (2, 1)
-        expected_line = shapely.LineString([(0.0, 1.0), (2.0, 1.0)])
-        result_line = shapely.LineString(result[0])
-        assert result_line.equals(expected_line)
+        # The clipped segment should be from (0, 1) to (2, 1); the output is
+        # structurally deterministic, so compare coordinates directly rather
+        # than via the GEOS equals predicate.
+        assert np.allclose(result[0], [(0.0, 1.0), (2.0, 1.0)])
 
-    def test_clip_line_inside_square(self) -> None:
+    def test_clip_line_inside_square(self, square_shapes: Shapes) -> None:
         """Test clipping a line entirely inside a square."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A line entirely inside
         polylines = [[(0.5, 1.0), (1.5, 1.0)]]
 
-        result = clip_by(polylines, shapes, FillRule.EvenOdd, ClipRule())
+        result = clip_by(polylines, square_shapes, FillRule.EvenOdd, ClipRule())
 
         # Line should be unchanged
         assert len(result) == 1
-        expected_line = shapely.LineString([(0.5, 1.0), (1.5, 1.0)])
-        result_line = shapely.LineString(result[0])
-        assert result_line.equals(expected_line)
+        assert np.allclose(result[0], [(0.5, 1.0), (1.5, 1.0)])
 
-    def test_clip_line_outside_square(self) -> None:
+    def test_clip_line_outside_square(self, square_shapes: Shapes) -> None:
         """Test clipping a line entirely outside a square."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A line entirely outside
         polylines = [[(5.0, 0.0), (5.0, 2.0)]]
 
-        result = clip_by(polylines, shapes, FillRule.EvenOdd, ClipRule())
+        result = clip_by(polylines, square_shapes, FillRule.EvenOdd, ClipRule())
 
         # No segments should remain
         assert len(result) == 0
@@ -60,15 +66,14 @@ class TestClipBasic:
 class TestClipInvert:
     """Tests for clip_by with invert option."""
 
-    def test_clip_invert(self) -> None:
+    def test_clip_invert(self, square_shapes: Shapes) -> None:
         """Test clipping with invert=True keeps outside portion."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A horizontal line passing through the square
         polylines = [[(-1.0, 1.0), (3.0, 1.0)]]
 
         result = clip_by(
             polylines,
-            shapes,
+            square_shapes,
             FillRule.EvenOdd,
             ClipRule(invert=True),
         )
@@ -76,22 +81,21 @@ class TestClipInvert:
         # Should produce two segments outside the square
         assert len(result) == 2
         # Total length should be 2 (1 unit on each side)
-        total_length = sum(shapely.LineString(r).length for r in result)
+        total_length = float(shapely.length(shapely.linestrings(result)).sum())
         assert abs(total_length - 2.0) < 1e-6
 
 
 class TestClipBoundary:
     """Tests for clip_by with boundary options."""
 
-    def test_clip_on_boundary_included(self) -> None:
+    def test_clip_on_boundary_included(self, square_shapes: Shapes) -> None:
         """Test clipping a line on the boundary with boundary_included=True."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A line along the left edge
         polylines = [[(0.0, 0.0), (0.0, 2.0)]]
 
         result = clip_by(
             polylines,
-            shapes,
+            square_shapes,
             FillRule.EvenOdd,
             ClipRule(boundary_included=True),
         )
@@ -99,15 +103,14 @@ class TestClipBoundary:
         # Boundary line should be included
         assert len(result) == 1
 
-    def test_clip_on_boundary_excluded(self) -> None:
+    def test_clip_on_boundary_excluded(self, square_shapes: Shapes) -> None:
         """Test clipping a line on the boundary with boundary_included=False."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A line along the left edge
         polylines = [[(0.0, 0.0), (0.0, 2.0)]]
 
         result = clip_by(
             polylines,
-            shapes,
+            square_shapes,
             FillRule.EvenOdd,
             ClipRule(boundary_included=False),
         )
@@ -119,76 +122,69 @@ class TestClipBoundary:
 class TestClipMultipleLines:
     """Tests for clipping multiple polylines."""
 
-    def test_clip_multiple_lines(self) -> None:
+    def test_clip_multiple_lines(self, square_shapes: Shapes) -> None:
         """Test clipping multiple polylines at once."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # Multiple lines
         polylines = [
             [(-1.0, 0.5), (3.0, 0.5)],  # Through bottom half
             [(-1.0, 1.5), (3.0, 1.5)],  # Through top half
         ]
 
-        result = clip_by(polylines, shapes, FillRule.EvenOdd, ClipRule())
+        result = clip_by(polylines, square_shapes, FillRule.EvenOdd, ClipRule())
 
         # Should produce two segments
         assert len(result) == 2
         # Each segment should have length 2
-        for segment in result:
-            length = shapely.LineString(segment).length
-            assert abs(length - 2.0) < 1e-6
+        lengths = shapely.length(shapely.linestrings(result))
+        assert np.allclose(lengths, 2.0, atol=1e-6)
 
 
 class TestClipComplexPath:
     """Tests for clipping complex polylines."""
 
-    def test_clip_polyline_multiple_segments(self) -> None:
+    def test_clip_polyline_multiple_segments(self, square_shapes: Shapes) -> None:
         """Test clipping a polyline with multiple segments."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         # A polyline that enters and exits the square multiple times
         polylines = [[(-1.0, 1.0), (1.0, 1.0), (1.0, 3.0)]]
 
-        result = clip_by(polylines, shapes, FillRule.EvenOdd, ClipRule())
+        result = clip_by(polylines, square_shapes, FillRule.EvenOdd, ClipRule())
 
         # Should produce segments for portions inside
         assert len(result) >= 1
         # Total area covered should be inside the square
+        square = shapely.box(0.0, 0.0, 2.0, 2.0)
         for segment in result:
             line = shapely.LineString(segment)
-            square = shapely.box(0.0, 0.0, 2.0, 2.0)
             assert square.contains(line) or square.touches(line)
 
 
 class TestClipWithSolver:
     """Tests for clip_by with custom solver."""
 
-    def test_with_solver(self) -> None:
+    def test_with_solver(self, square_shapes: Shapes) -> None:
         """Test clip_by with custom solver."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         polylines = [[(-1.0, 1.0), (3.0, 1.0)]]
 
         result = clip_by(
             polylines,
-            shapes,
+            square_shapes,
             FillRule.EvenOdd,
             ClipRule(),
             solver=Solver.AUTO,
         )
 
         assert len(result) == 1
-        expected_line = shapely.LineString([(0.0, 1.0), (2.0, 1.0)])
-        result_line = shapely.LineString(result[0])
-        assert result_line.equals(expected_line)
+        assert np.allclose(result[0], [(0.0, 1.0), (2.0, 1.0)])
 
 
 class TestClipEdgeCases:
     """Tests for clip_by edge cases."""
 
-    def test_empty_polylines(self) -> None:
+    def test_empty_polylines(self, square_shapes: Shapes) -> None:
         """Test clipping empty polylines."""
-        shapes = box(0.0, 0.0, 2.0, 2.0)
         polylines: list[list[tuple[float, float]]] = []
 
-        result = clip_by(polylines, shapes, FillRule.EvenOdd, ClipRule())
+        result = clip_by(polylines, square_shapes, FillRule.EvenOdd, ClipRule())
 
         assert len(result) == 0
 
@@ -218,6 +214,6 @@ class TestClipEdgeCases:
         # Should produce two segments (one on each side of the hole)
         assert len(result) == 2
         # Each segment should be 1 unit long (from 0-1 and 3-4)
-        lengths = sorted(shapely.LineString(r).length for r in result)
+        lengths = np.sort(shapely.length(shapely.linestrings(result)))
         assert abs(lengths[0] - 1.0) < 1e-6
         assert abs(lengths[1] - 1.0) < 1e-6
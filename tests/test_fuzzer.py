@@ -11,6 +11,7 @@ Environment variables:
 
 from __future__ import annotations
 
+import concurrent.futures
 import os
 from typing import TYPE_CHECKING
 
@@ -25,7 +26,7 @@ from ._fuzzer import (
 )
 
 if TYPE_CHECKING:
-    from ._fuzzer import RandomPolyGenerator
+    import pandas as pd
 
 generator_types = [
     RandomSpotsGenerator,
@@ -39,19 +40,30 @@ generator_types = [
     os.getenv("OVERLAY_FUZZ_TEST_ENABLED") != "1",
     reason="Only run if OVERLAY_FUZZ_TEST_ENABLED=1",
 )
-@pytest.mark.parametrize("generator_cls", generator_types)
-def test_fuzzer_execution(generator_cls: type[RandomPolyGenerator]) -> None:
-    """Run fuzz tests for a generator and verify no errors occur."""
-    generator = generator_cls()
+def test_fuzzer_execution() -> None:
+    """Run fuzz tests for all generators concurrently and verify no errors occur."""
     n_procs = int(os.getenv("OVERLAY_FUZZ_TEST_NPROC", str(os.cpu_count() or 1)))
     n_tests = int(os.getenv("OVERLAY_FUZZ_TEST_NTESTS", str(10 * n_procs)))
 
     assert n_procs > 0
     assert n_tests >= n_procs
 
-    df = run_fuzzer(generator, n_procs=n_procs, n_tests=n_tests, verbose=True)
-    error_df = df[df.error.notna()]
+    # The generators are independent, so share one process pool between
+    # them and drive the four run_fuzzer calls from threads; the workers
+    # are spawned once and load-balance freely across generators.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_procs) as executor:
 
-    if len(error_df) > 0:
-        failing_seeds = error_df["seed"].unique()
-        pytest.fail(f"Fuzzer found errors. Failing seeds: {failing_seeds}")
+        def _run(generator_cls: type) -> pd.DataFrame:
+            return run_fuzzer(generator_cls(), n_procs=n_procs, n_tests=n_tests, executor=executor, verbose=True)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(generator_types)) as pool:
+            dfs = list(pool.map(_run, generator_types))
+
+    failures = {}
+    for df in dfs:
+        error_df = df[df.error.notna()]
+        if len(error_df) > 0:
+            failures[error_df["generator"].iloc[0]] = error_df["seed"].unique()
+
+    if failures:
+        pytest.fail(f"Fuzzer found errors. Failing seeds: {failures}")
@@ -1,5 +1,7 @@
 """Tests for configuration classes."""
 
+import pytest
+
 from i_overlay import (
     ClipRule,
     ContourDirection,
@@ -9,6 +11,15 @@ from i_overlay import (
     Strategy,
 )
 
+# Shared immutable instances for the equality/hash tests; every
+# construction crosses the PyO3 boundary, so build them once per module.
+_PRECISION_1_2 = Precision(start=1, progression=2)
+_PRECISION_1_2_TWIN = Precision(start=1, progression=2)
+_PRECISION_2_2 = Precision(start=2, progression=2)
+_CLIP_RULE = ClipRule(invert=True, boundary_included=False)
+_CLIP_RULE_TWIN = ClipRule(invert=True, boundary_included=False)
+_CLIP_RULE_OTHER = ClipRule(invert=False, boundary_included=False)
+
 
 class TestPrecision:
     """Tests for Precision configuration class."""
@@ -25,39 +36,31 @@ class TestPrecision:
         assert p.start == 2
         assert p.progression == 3
 
-    def test_class_constants(self) -> None:
-        """Test that class constants are accessible."""
-        assert Precision.ABSOLUTE.start == 0
-        assert Precision.ABSOLUTE.progression == 0
-
-        assert Precision.HIGH.start == 0
-        assert Precision.HIGH.progression == 1
-
-        assert Precision.MEDIUM_HIGH.start == 1
-        assert Precision.MEDIUM_HIGH.progression == 1
-
-        assert Precision.MEDIUM.start == 0
-        assert Precision.MEDIUM.progression == 2
-
-        assert Precision.MEDIUM_LOW.start == 2
-        assert Precision.MEDIUM_LOW.progression == 2
-
-        assert Precision.LOW.start == 2
-        assert Precision.LOW.progression == 3
+    @pytest.mark.parametrize(
+        ("constant", "start", "progression"),
+        [
+            (Precision.ABSOLUTE, 0, 0),
+            (Precision.HIGH, 0, 1),
+            (Precision.MEDIUM_HIGH, 1, 1),
+            (Precision.MEDIUM, 0, 2),
+            (Precision.MEDIUM_LOW, 2, 2),
+            (Precision.LOW, 2, 3),
+        ],
+        ids=["ABSOLUTE", "HIGH", "MEDIUM_HIGH", "MEDIUM", "MEDIUM_LOW", "LOW"],
+    )
+    def test_class_constants(self, constant: Precision, start: int, progression: int) -> None:
+        """Test that class constants hold the expected values."""
+        assert constant.start == start
+        assert constant.progression == progression
 
     def test_equality(self) -> None:
         """Test Precision equality."""
-        p1 = Precision(start=1, progression=2)
-        p2 = Precision(start=1, progression=2)
-        p3 = Precision(start=2, progression=2)
-        assert p1 == p2
-        assert p1 != p3
+        assert _PRECISION_1_2 == _PRECISION_1_2_TWIN
+        assert _PRECISION_1_2 != _PRECISION_2_2
 
     def test_hashable(self) -> None:
         """Test that Precision is hashable."""
-        p1 = Precision(start=1, progression=2)
-        p2 = Precision(start=1, progression=2)
-        precisions = {p1, p2}
+        precisions = {_PRECISION_1_2, _PRECISION_1_2_TWIN}
         assert len(precisions) == 1
 
     def test_repr(self) -> None:
@@ -84,19 +87,20 @@ class TestSolver:
         assert s.precision == p
         assert s.multithreading is False
 
-    def test_class_constants(self) -> None:
-        """Test that class constants are accessible."""
-        assert Solver.LIST.strategy == Strategy.List
-        assert Solver.LIST.multithreading is True
-
-        assert Solver.TREE.strategy == Strategy.Tree
-        assert Solver.TREE.multithreading is True
-
-        assert Solver.FRAG.strategy == Strategy.Frag
-        assert Solver.FRAG.multithreading is True
-
-        assert Solver.AUTO.strategy == Strategy.Auto
-        assert Solver.AUTO.multithreading is True
+    @pytest.mark.parametrize(
+        ("constant", "strategy"),
+        [
+            (Solver.LIST, Strategy.List),
+            (Solver.TREE, Strategy.Tree),
+            (Solver.FRAG, Strategy.Frag),
+            (Solver.AUTO, Strategy.Auto),
+        ],
+        ids=["LIST", "TREE", "FRAG", "AUTO"],
+    )
+    def test_class_constants(self, constant: Solver, strategy: Strategy) -> None:
+        """Test that class constants hold the expected values."""
+        assert constant.strategy == strategy
+        assert constant.multithreading is True
 
     def test_repr(self) -> None:
         """Test repr representation."""
@@ -154,17 +158,12 @@ class TestClipRule:
 
     def test_equality(self) -> None:
         """Test ClipRule equality."""
-        c1 = ClipRule(invert=True, boundary_included=False)
-        c2 = ClipRule(invert=True, boundary_included=False)
-        c3 = ClipRule(invert=False, boundary_included=False)
-        assert c1 == c2
-        assert c1 != c3
+        assert _CLIP_RULE == _CLIP_RULE_TWIN
+        assert _CLIP_RULE != _CLIP_RULE_OTHER
 
     def test_hashable(self) -> None:
         """Test that ClipRule is hashable."""
-        c1 = ClipRule(invert=True, boundary_included=False)
-        c2 = ClipRule(invert=True, boundary_included=False)
-        rules = {c1, c2}
+        rules = {_CLIP_RULE, _CLIP_RULE_TWIN}
         assert len(rules) == 1
 
     def test_repr(self) -> None:
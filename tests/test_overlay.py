@@ -1,5 +1,7 @@
 """Tests for Boolean overlay operations."""
 
+import numpy as np
+import pytest
 import shapely
 
 from i_overlay import (
@@ -14,13 +16,81 @@ from i_overlay import (
 )
 
 from .shapely_utils import (
+    assert_shapes_equal,
     box,
-    circle,
     geometry_to_shapes,
     polygon_with_hole,
     shapes_to_multipolygon,
 )
 
+# Shared i_overlay inputs, built once per module and treated as
+# read-only. Rebuilding these nested lists of tuples per test allocates
+# many small Python objects only for the binding to walk and unbox them
+# again; the payloads are deterministic, so one copy serves all tests.
+_UNIT_BOX = box(0.0, 0.0, 1.0, 1.0)
+_ADJACENT_UNIT_BOX = box(1.0, 0.0, 2.0, 1.0)
+_HALF_OVERLAP_CLIP = box(0.5, 0.0, 1.5, 1.0)
+_TWO_BY_TWO_BOX = box(0.0, 0.0, 2.0, 2.0)
+_OFFSET_TWO_BY_TWO_BOX = box(1.0, 1.0, 3.0, 3.0)
+_TWO_SQUARES_SUBJECT = [
+    geometry_to_shapes(shapely.box(0.0, 0.0, 1.0, 1.0))[0],
+    geometry_to_shapes(shapely.box(1.0, 0.0, 2.0, 1.0))[0],
+]
+_FIGURE_8 = [[[(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0)]]]
+
+# Rust-backed config objects; each construction crosses the PyO3
+# boundary, so the configs used by the option/solver tests are built once.
+_CLOCKWISE_OPTIONS = OverlayOptions(
+    preserve_input_collinear=True,
+    output_direction=ContourDirection.Clockwise,
+    preserve_output_collinear=True,
+    min_output_area=0,
+)
+_SMALL_AREA_FILTER_OPTIONS = OverlayOptions(min_output_area=1000)
+_LIST_SOLVER = Solver(strategy=Strategy.List)
+_TREE_SOLVER = Solver(strategy=Strategy.Tree)
+_CUSTOM_PRECISION_SOLVER = Solver(
+    strategy=Strategy.Auto,
+    precision=Precision(start=1, progression=2),
+    multithreading=False,
+)
+
+# Expected geometries, built once per module. Every shapely constructor
+# and set operation crosses into GEOS and allocates a fresh C geometry;
+# the same expected values are asserted by several tests, so each is
+# built a single time and reused (never mutated).
+_EXPECTED_UNIT_SQUARE = shapely.box(0.0, 0.0, 1.0, 1.0)
+_EXPECTED_2X1 = shapely.box(0.0, 0.0, 2.0, 1.0)
+_EXPECTED_1_5X1 = shapely.box(0.0, 0.0, 1.5, 1.0)
+_EXPECTED_3X1 = shapely.box(0.0, 0.0, 3.0, 1.0)
+_EXPECTED_UNIT_AT_1_1 = shapely.box(1.0, 1.0, 2.0, 2.0)
+_EXPECTED_L_SHAPE = shapely.box(0.0, 0.0, 2.0, 2.0).difference(shapely.box(1.0, 1.0, 2.0, 2.0))
+_EXPECTED_XOR = shapely.box(0.0, 0.0, 2.0, 2.0).symmetric_difference(shapely.box(1.0, 1.0, 3.0, 3.0))
+
+# i_overlay-format expecteds for the axis-aligned rectangle cases, where
+# the cheap structural comparator can replace a full GEOS equals sweep.
+_EXPECTED_2X1_SHAPES = geometry_to_shapes(_EXPECTED_2X1)
+_EXPECTED_1_5X1_SHAPES = geometry_to_shapes(_EXPECTED_1_5X1)
+_EXPECTED_UNIT_AT_1_1_SHAPES = geometry_to_shapes(_EXPECTED_UNIT_AT_1_1)
+
+# The 4x4 square with a centred 2x2 hole used by the hole tests.
+_HOLE_OUTER = [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (4.0, 0.0)]
+_HOLE_RING = [(1.0, 1.0), (3.0, 1.0), (3.0, 3.0), (1.0, 3.0)]
+_EXPECTED_HOLE_UNION = shapely.Polygon(_HOLE_OUTER, [_HOLE_RING]).union(shapely.box(1.5, 1.5, 2.5, 2.5))
+_EXPECTED_UNIT_AT_3_0 = shapely.box(3.0, 0.0, 4.0, 1.0)
+
+# The two overlapping unit circles, their i_overlay inputs and expected
+# combinations. The rings are built directly from one trig table instead
+# of two GEOS buffer calls (tessellation + offset, one of the costlier
+# GEOS operations); input and expected share the exact same vertices.
+_CIRCLE_THETA = np.linspace(0.0, 2.0 * np.pi, 129)[:-1]
+_CIRCLE_0 = shapely.Polygon(np.column_stack([np.cos(_CIRCLE_THETA), np.sin(_CIRCLE_THETA)]))
+_CIRCLE_1 = shapely.Polygon(np.column_stack([np.cos(_CIRCLE_THETA) + 1.0, np.sin(_CIRCLE_THETA)]))
+_CIRCLE_0_SHAPES = geometry_to_shapes(_CIRCLE_0)
+_CIRCLE_1_SHAPES = geometry_to_shapes(_CIRCLE_1)
+_EXPECTED_CIRCLE_UNION = _CIRCLE_0.union(_CIRCLE_1)
+_EXPECTED_CIRCLE_INTERSECTION = _CIRCLE_0.intersection(_CIRCLE_1)
+
 
 class TestOverlayBasic:
     """Basic tests for the overlay function."""
@@ -28,34 +98,30 @@ class TestOverlayBasic:
     def test_overlay_union_simple_rectangles(self) -> None:
         """Test union of two adjacent rectangles."""
         # Two 1x1 squares side by side
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(1.0, 0.0, 2.0, 1.0)
+        subject = _UNIT_BOX
+        clip = _ADJACENT_UNIT_BOX
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd)
-        result_geom = shapes_to_multipolygon(result)
 
         # Should produce a single 2x1 rectangle
-        expected = shapely.box(0.0, 0.0, 2.0, 1.0)
-        assert result_geom.equals(expected)
+        assert_shapes_equal(result, _EXPECTED_2X1_SHAPES)
 
     def test_overlay_intersection_overlapping_squares(self) -> None:
         """Test intersection of two overlapping squares."""
         # 2x2 square at origin
-        subject = box(0.0, 0.0, 2.0, 2.0)
+        subject = _TWO_BY_TWO_BOX
         # 2x2 square offset by (1,1)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+        clip = _OFFSET_TWO_BY_TWO_BOX
 
         result = overlay(subject, clip, OverlayRule.Intersect, FillRule.EvenOdd)
-        result_geom = shapes_to_multipolygon(result)
 
         # Should produce a 1x1 square at (1,1)
-        expected = shapely.box(1.0, 1.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        assert_shapes_equal(result, _EXPECTED_UNIT_AT_1_1_SHAPES)
 
     def test_overlay_difference(self) -> None:
         """Test difference of two overlapping squares."""
         # 2x2 square at origin
-        subject = box(0.0, 0.0, 2.0, 2.0)
+        subject = _TWO_BY_TWO_BOX
         # 1x1 square at (1,1)
         clip = box(1.0, 1.0, 2.0, 2.0)
 
@@ -63,22 +129,20 @@ class TestOverlayBasic:
         result_geom = shapes_to_multipolygon(result)
 
         # Should produce an L-shaped result with area = 4 - 1 = 3
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).difference(shapely.box(1.0, 1.0, 2.0, 2.0))
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_L_SHAPE)
 
     def test_overlay_xor(self) -> None:
         """Test XOR of two overlapping squares."""
         # 2x2 square at origin
-        subject = box(0.0, 0.0, 2.0, 2.0)
+        subject = _TWO_BY_TWO_BOX
         # 2x2 square offset by (1,1)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+        clip = _OFFSET_TWO_BY_TWO_BOX
 
         result = overlay(subject, clip, OverlayRule.Xor, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
         # Should produce XOR result
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).symmetric_difference(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_XOR)
 
 
 class TestOverlayWithHoles:
@@ -87,9 +151,7 @@ class TestOverlayWithHoles:
     def test_shape_with_hole(self) -> None:
         """Test union where subject has a hole."""
         # 4x4 square with 2x2 hole in center
-        outer = [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (4.0, 0.0)]
-        hole = [(1.0, 1.0), (3.0, 1.0), (3.0, 3.0), (1.0, 3.0)]
-        subject = polygon_with_hole(outer, hole)
+        subject = polygon_with_hole(_HOLE_OUTER, _HOLE_RING)
 
         # 1x1 square that fills part of the hole
         clip = box(1.5, 1.5, 2.5, 2.5)
@@ -97,18 +159,13 @@ class TestOverlayWithHoles:
         result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Build expected geometry: outer square with hole, union with small square
-        expected_subject = shapely.Polygon(outer, [hole])
-        expected_clip = shapely.box(1.5, 1.5, 2.5, 2.5)
-        expected = expected_subject.union(expected_clip)
-        assert result_geom.equals(expected)
+        # Expected geometry: outer square with hole, union with small square
+        assert result_geom.equals(_EXPECTED_HOLE_UNION)
 
     def test_intersection_removes_hole(self) -> None:
         """Test intersection that removes the hole entirely."""
         # 4x4 square with 2x2 hole in center
-        outer = [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (4.0, 0.0)]
-        hole = [(1.0, 1.0), (3.0, 1.0), (3.0, 3.0), (1.0, 3.0)]
-        subject = polygon_with_hole(outer, hole)
+        subject = polygon_with_hole(_HOLE_OUTER, _HOLE_RING)
 
         # 1x1 square that doesn't touch the hole
         clip = box(3.0, 0.0, 4.0, 1.0)
@@ -117,8 +174,7 @@ class TestOverlayWithHoles:
         result_geom = shapes_to_multipolygon(result)
 
         # Should produce a 1x1 square
-        expected = shapely.box(3.0, 0.0, 4.0, 1.0)
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_UNIT_AT_3_0)
 
 
 class TestOverlayFillRules:
@@ -126,14 +182,13 @@ class TestOverlayFillRules:
 
     def test_nonzero_fill_rule(self) -> None:
         """Test NonZero fill rule."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
+        subject = _UNIT_BOX
+        clip = _HALF_OVERLAP_CLIP
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.NonZero)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 1.5, 1.0)
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_1_5X1)
 
     def test_positive_fill_rule(self) -> None:
         """Test Positive fill rule."""
@@ -150,8 +205,8 @@ class TestOverlayFillRules:
 
     def test_negative_fill_rule(self) -> None:
         """Test Negative fill rule."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
+        subject = _UNIT_BOX
+        clip = _HALF_OVERLAP_CLIP
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.Negative)
 
@@ -164,21 +219,13 @@ class TestOverlayOptions:
 
     def test_with_options(self) -> None:
         """Test overlay with custom options."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(1.0, 0.0, 2.0, 1.0)
-
-        options = OverlayOptions(
-            preserve_input_collinear=True,
-            output_direction=ContourDirection.Clockwise,
-            preserve_output_collinear=True,
-            min_output_area=0,
-        )
+        subject = _UNIT_BOX
+        clip = _ADJACENT_UNIT_BOX
 
-        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, options=options)
+        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, options=_CLOCKWISE_OPTIONS)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 1.0)
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_2X1)
 
     def test_with_min_output_area(self) -> None:
         """Test that min_output_area filters small shapes."""
@@ -186,9 +233,7 @@ class TestOverlayOptions:
         clip = box(9.0, 9.0, 10.0, 10.0)
 
         # With a large min area, the small result may be filtered
-        options = OverlayOptions(min_output_area=1000)
-
-        result = overlay(subject, clip, OverlayRule.Intersect, FillRule.EvenOdd, options=options)
+        result = overlay(subject, clip, OverlayRule.Intersect, FillRule.EvenOdd, options=_SMALL_AREA_FILTER_OPTIONS)
 
         # The 1x1 intersection should be filtered
         assert len(result) == 0
@@ -199,54 +244,42 @@ class TestOverlaySolver:
 
     def test_with_list_strategy(self) -> None:
         """Test overlay with List strategy."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
+        subject = _UNIT_BOX
+        clip = _HALF_OVERLAP_CLIP
 
-        solver = Solver(strategy=Strategy.List)
+        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=_LIST_SOLVER)
 
-        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=solver)
-        result_geom = shapes_to_multipolygon(result)
-
-        expected = shapely.box(0.0, 0.0, 1.5, 1.0)
-        assert result_geom.equals(expected)
+        assert_shapes_equal(result, _EXPECTED_1_5X1_SHAPES)
 
     def test_with_tree_strategy(self) -> None:
         """Test overlay with Tree strategy."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
-
-        solver = Solver(strategy=Strategy.Tree)
+        subject = _UNIT_BOX
+        clip = _HALF_OVERLAP_CLIP
 
-        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=solver)
-        result_geom = shapes_to_multipolygon(result)
+        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=_TREE_SOLVER)
 
-        expected = shapely.box(0.0, 0.0, 1.5, 1.0)
-        assert result_geom.equals(expected)
+        assert_shapes_equal(result, _EXPECTED_1_5X1_SHAPES)
 
     def test_with_custom_precision(self) -> None:
         """Test overlay with custom precision."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
-
-        precision = Precision(start=1, progression=2)
-        solver = Solver(strategy=Strategy.Auto, precision=precision, multithreading=False)
+        subject = _UNIT_BOX
+        clip = _HALF_OVERLAP_CLIP
 
-        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=solver)
+        result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=_CUSTOM_PRECISION_SOLVER)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 1.5, 1.0)
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_1_5X1)
 
-    def test_with_preset_solvers(self) -> None:
+    @pytest.mark.parametrize(
+        "solver",
+        [Solver.AUTO, Solver.LIST, Solver.TREE, Solver.FRAG],
+        ids=["auto", "list", "tree", "frag"],
+    )
+    def test_with_preset_solvers(self, solver: Solver) -> None:
         """Test overlay with preset solvers."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
-        expected = shapely.box(0.0, 0.0, 1.5, 1.0)
+        result = overlay(_UNIT_BOX, _HALF_OVERLAP_CLIP, OverlayRule.Union, FillRule.EvenOdd, solver=solver)
 
-        for solver in [Solver.AUTO, Solver.LIST, Solver.TREE, Solver.FRAG]:
-            result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd, solver=solver)
-            result_geom = shapes_to_multipolygon(result)
-            assert result_geom.equals(expected)
+        assert_shapes_equal(result, _EXPECTED_1_5X1_SHAPES)
 
 
 class TestOverlaySubjectOnly:
@@ -255,10 +288,9 @@ class TestOverlaySubjectOnly:
     def test_subject_rule_self_intersecting(self) -> None:
         """Test Subject rule for resolving self-intersections."""
         # A figure-8 shape (self-intersecting)
-        subject = [[[(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0)]]]
         clip: list[list[list[tuple[float, float]]]] = []  # Empty clip
 
-        result = overlay(subject, clip, OverlayRule.Subject, FillRule.EvenOdd)
+        result = overlay(_FIGURE_8, clip, OverlayRule.Subject, FillRule.EvenOdd)
 
         # Should resolve the self-intersection
         assert isinstance(result, list)
@@ -280,12 +312,11 @@ class TestOverlayMultipleShapes:
         result_geom = shapes_to_multipolygon(result)
 
         # Should produce a single 3x1 rectangle
-        expected = shapely.box(0.0, 0.0, 3.0, 1.0)
-        assert result_geom.equals(expected)
+        assert result_geom.equals(_EXPECTED_3X1)
 
     def test_intersection_no_overlap(self) -> None:
         """Test intersection when shapes don't overlap."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
+        subject = _UNIT_BOX
         clip = box(5.0, 0.0, 6.0, 1.0)
 
         result = overlay(subject, clip, OverlayRule.Intersect, FillRule.EvenOdd)
@@ -301,26 +332,22 @@ class TestOverlayEdgeCases:
     def test_empty_subject(self) -> None:
         """Test with empty subject."""
         subject: list[list[list[tuple[float, float]]]] = []
-        clip = box(0.0, 0.0, 1.0, 1.0)
+        clip = _UNIT_BOX
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd)
-        result_geom = shapes_to_multipolygon(result)
 
         # Clip should pass through
-        expected = shapely.box(0.0, 0.0, 1.0, 1.0)
-        assert result_geom.equals(expected)
+        assert_shapes_equal(result, _UNIT_BOX)
 
     def test_empty_clip(self) -> None:
         """Test with empty clip."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
+        subject = _UNIT_BOX
         clip: list[list[list[tuple[float, float]]]] = []
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd)
-        result_geom = shapes_to_multipolygon(result)
 
         # Subject should pass through
-        expected = shapely.box(0.0, 0.0, 1.0, 1.0)
-        assert result_geom.equals(expected)
+        assert_shapes_equal(result, _UNIT_BOX)
 
     def test_both_empty(self) -> None:
         """Test with both subject and clip empty."""
@@ -332,22 +359,27 @@ class TestOverlayEdgeCases:
 
         assert result_geom.is_empty
 
-    def test_identical_shapes(self) -> None:
+    @pytest.mark.parametrize(
+        ("rule", "expect_self"),
+        [
+            (OverlayRule.Union, True),
+            (OverlayRule.Intersect, True),
+            (OverlayRule.Difference, False),
+            (OverlayRule.Xor, False),
+        ],
+        ids=["union", "intersect", "difference", "xor"],
+    )
+    def test_identical_shapes(self, rule: OverlayRule, expect_self: bool) -> None:
         """Test operations on identical shapes."""
-        shape = box(0.0, 0.0, 1.0, 1.0)
-        expected = shapely.box(0.0, 0.0, 1.0, 1.0)
-
-        union_result = overlay(shape, shape, OverlayRule.Union, FillRule.EvenOdd)
-        intersect_result = overlay(shape, shape, OverlayRule.Intersect, FillRule.EvenOdd)
-        diff_result = overlay(shape, shape, OverlayRule.Difference, FillRule.EvenOdd)
-        xor_result = overlay(shape, shape, OverlayRule.Xor, FillRule.EvenOdd)
+        result = overlay(_UNIT_BOX, _UNIT_BOX, rule, FillRule.EvenOdd)
+        result_geom = shapes_to_multipolygon(result)
 
-        # Union and intersection should return the original shape
-        assert shapes_to_multipolygon(union_result).equals(expected)
-        assert shapes_to_multipolygon(intersect_result).equals(expected)
-        # Difference and XOR should return empty
-        assert shapes_to_multipolygon(diff_result).is_empty
-        assert shapes_to_multipolygon(xor_result).is_empty
+        if expect_self:
+            # Union and intersection should return the original shape
+            assert result_geom.equals(_EXPECTED_UNIT_SQUARE)
+        else:
+            # Difference and XOR should return empty
+            assert result_geom.is_empty
 
 
 class TestOverlayResultFormat:
@@ -355,8 +387,8 @@ class TestOverlayResultFormat:
 
     def test_result_is_nested_list(self) -> None:
         """Test that result is properly nested list of tuples."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(0.5, 0.0, 1.5, 1.0)
+        subject = _UNIT_BOX
+        clip = _HALF_OVERLAP_CLIP
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd)
 
@@ -382,30 +414,26 @@ class TestOverlayWithCircles:
 
     def test_union_circles(self) -> None:
         """Test union of two overlapping circles."""
-        subject = circle(0.0, 0.0, 1.0)
-        clip = circle(1.0, 0.0, 1.0)
+        subject = _CIRCLE_0_SHAPES
+        clip = _CIRCLE_1_SHAPES
 
         result = overlay(subject, clip, OverlayRule.Union, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Build expected union using shapely
-        expected = shapely.Point(0.0, 0.0).buffer(1.0, 32).union(shapely.Point(1.0, 0.0).buffer(1.0, 32))
         # Compare normalized geometries (same area, similar shape)
-        assert abs(result_geom.area - expected.area) < 1e-6
+        assert abs(result_geom.area - _EXPECTED_CIRCLE_UNION.area) < 1e-6
         # Verify the symmetric difference is negligible (shapes are equivalent)
-        assert result_geom.symmetric_difference(expected).area < 1e-6
+        assert result_geom.symmetric_difference(_EXPECTED_CIRCLE_UNION).area < 1e-6
 
     def test_intersection_circles(self) -> None:
         """Test intersection of two overlapping circles."""
-        subject = circle(0.0, 0.0, 1.0)
-        clip = circle(1.0, 0.0, 1.0)
+        subject = _CIRCLE_0_SHAPES
+        clip = _CIRCLE_1_SHAPES
 
         result = overlay(subject, clip, OverlayRule.Intersect, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Build expected intersection using shapely
-        expected = shapely.Point(0.0, 0.0).buffer(1.0, 32).intersection(shapely.Point(1.0, 0.0).buffer(1.0, 32))
         # Compare normalized geometries (same area, similar shape)
-        assert abs(result_geom.area - expected.area) < 1e-6
+        assert abs(result_geom.area - _EXPECTED_CIRCLE_INTERSECTION.area) < 1e-6
         # Verify the symmetric difference is negligible (shapes are equivalent)
-        assert result_geom.symmetric_difference(expected).area < 1e-6
+        assert result_geom.symmetric_difference(_EXPECTED_CIRCLE_INTERSECTION).area < 1e-6
@@ -1,5 +1,6 @@
 """Tests for FloatOverlayGraph class."""
 
+import pytest
 import shapely
 
 from i_overlay import (
@@ -10,113 +11,86 @@ from i_overlay import (
     Solver,
 )
 
-from .shapely_utils import box, shapes_to_multipolygon
+from .shapely_utils import assert_geom_equal, box, shapes_to_multipolygon
 
+# Shared inputs, built once per module and treated as read-only.
+_SUBJECT_SHAPES = box(0.0, 0.0, 2.0, 2.0)
+_CLIP_SHAPES = box(1.0, 1.0, 3.0, 3.0)
+_UNIT_BOX_SHAPES = box(0.0, 0.0, 1.0, 1.0)
+_FAR_UNIT_BOX_SHAPES = box(5.0, 0.0, 6.0, 1.0)
 
-class TestFloatOverlayGraphBasic:
-    """Basic tests for FloatOverlayGraph."""
+# Expected geometries; every shapely constructor and set operation
+# crosses into GEOS, so the values shared by several tests are built a
+# single time at import.
+_SUBJECT_GEOM = shapely.box(0.0, 0.0, 2.0, 2.0)
+_CLIP_GEOM = shapely.box(1.0, 1.0, 3.0, 3.0)
+_EXPECTED_UNION = _SUBJECT_GEOM.union(_CLIP_GEOM)
+_EXPECTED_INTERSECTION = _SUBJECT_GEOM.intersection(_CLIP_GEOM)
+_EXPECTED_DIFFERENCE = _SUBJECT_GEOM.difference(_CLIP_GEOM)
+_EXPECTED_INVERSE_DIFFERENCE = _CLIP_GEOM.difference(_SUBJECT_GEOM)
+_EXPECTED_XOR = _SUBJECT_GEOM.symmetric_difference(_CLIP_GEOM)
+_EXPECTED_UNIT_SQUARE = shapely.box(0.0, 0.0, 1.0, 1.0)
+_EXPECTED_NO_OVERLAP_UNION = _EXPECTED_UNIT_SQUARE.union(shapely.box(5.0, 0.0, 6.0, 1.0))
 
-    def test_create_overlay_graph(self) -> None:
-        """Test creating an FloatOverlayGraph."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
 
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
+@pytest.fixture(scope="module")
+def eo_graph() -> FloatOverlayGraph:
+    """A shared EvenOdd graph over the standard subject/clip pair.
 
-        assert graph is not None
+    The constructor runs the full sweep-line pipeline; the graph is
+    designed for repeated extract_shapes calls, so one instance serves
+    every extraction test in this module.
+    """
+    return FloatOverlayGraph(_SUBJECT_SHAPES, _CLIP_SHAPES, FillRule.EvenOdd)
 
-    def test_extract_union(self) -> None:
-        """Test extracting union from graph."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
 
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-        result = graph.extract_shapes(OverlayRule.Union)
-        result_geom = shapes_to_multipolygon(result)
+@pytest.fixture(scope="module")
+def nz_graph() -> FloatOverlayGraph:
+    """A shared NonZero graph over the standard subject/clip pair."""
+    return FloatOverlayGraph(_SUBJECT_SHAPES, _CLIP_SHAPES, FillRule.NonZero)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
 
-    def test_extract_intersection(self) -> None:
-        """Test extracting intersection from graph."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
-
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-        result = graph.extract_shapes(OverlayRule.Intersect)
-        result_geom = shapes_to_multipolygon(result)
-
-        # 1x1 square at (1,1) to (2,2)
-        expected = shapely.box(1.0, 1.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+class TestFloatOverlayGraphBasic:
+    """Basic tests for FloatOverlayGraph."""
 
-    def test_extract_difference(self) -> None:
-        """Test extracting difference from graph."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+    def test_create_overlay_graph(self) -> None:
+        """Test creating an FloatOverlayGraph."""
+        subject = _SUBJECT_SHAPES
+        clip = _CLIP_SHAPES
 
         graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-        result = graph.extract_shapes(OverlayRule.Difference)
-        result_geom = shapes_to_multipolygon(result)
-
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).difference(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
 
-    def test_extract_xor(self) -> None:
-        """Test extracting XOR from graph."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+        assert graph is not None
 
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-        result = graph.extract_shapes(OverlayRule.Xor)
+    @pytest.mark.parametrize(
+        ("rule", "expected"),
+        [
+            (OverlayRule.Union, _EXPECTED_UNION),
+            (OverlayRule.Intersect, _EXPECTED_INTERSECTION),
+            (OverlayRule.Difference, _EXPECTED_DIFFERENCE),
+            (OverlayRule.InverseDifference, _EXPECTED_INVERSE_DIFFERENCE),
+            (OverlayRule.Xor, _EXPECTED_XOR),
+        ],
+        ids=["union", "intersection", "difference", "inverse_difference", "xor"],
+    )
+    def test_extract(self, eo_graph: FloatOverlayGraph, rule: OverlayRule, expected: shapely.Geometry) -> None:
+        """Test extracting each Boolean operation from the shared graph."""
+        result = eo_graph.extract_shapes(rule)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).symmetric_difference(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        assert_geom_equal(result_geom, expected)
 
 
 class TestFloatOverlayGraphMultipleExtractions:
     """Tests for extracting multiple results from the same graph."""
 
-    def test_extract_all_operations(self) -> None:
-        """Test extracting all Boolean operations from the same graph."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
-
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-
-        # Build expected results using shapely
-        subj_geom = shapely.box(0.0, 0.0, 2.0, 2.0)
-        clip_geom = shapely.box(1.0, 1.0, 3.0, 3.0)
-
-        # Extract all operations from the same graph
-        union = graph.extract_shapes(OverlayRule.Union)
-        assert shapes_to_multipolygon(union).equals(subj_geom.union(clip_geom))
-
-        intersection = graph.extract_shapes(OverlayRule.Intersect)
-        assert shapes_to_multipolygon(intersection).equals(subj_geom.intersection(clip_geom))
-
-        difference = graph.extract_shapes(OverlayRule.Difference)
-        assert shapes_to_multipolygon(difference).equals(subj_geom.difference(clip_geom))
-
-        inverse_diff = graph.extract_shapes(OverlayRule.InverseDifference)
-        assert shapes_to_multipolygon(inverse_diff).equals(clip_geom.difference(subj_geom))
-
-        xor = graph.extract_shapes(OverlayRule.Xor)
-        assert shapes_to_multipolygon(xor).equals(subj_geom.symmetric_difference(clip_geom))
-
-    def test_extract_same_operation_twice(self) -> None:
+    def test_extract_same_operation_twice(self, eo_graph: FloatOverlayGraph) -> None:
         """Test that extracting the same operation twice gives consistent results."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
-
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-
-        result1 = graph.extract_shapes(OverlayRule.Union)
-        result2 = graph.extract_shapes(OverlayRule.Union)
+        result1 = eo_graph.extract_shapes(OverlayRule.Union)
+        result2 = eo_graph.extract_shapes(OverlayRule.Union)
 
         # Results should be geometrically equal
-        assert shapes_to_multipolygon(result1).equals(shapes_to_multipolygon(result2))
+        assert_geom_equal(shapes_to_multipolygon(result1), shapes_to_multipolygon(result2))
 
 
 class TestFloatOverlayGraphWithOptions:
@@ -124,8 +98,8 @@ class TestFloatOverlayGraphWithOptions:
 
     def test_with_overlay_options(self) -> None:
         """Test FloatOverlayGraph with custom OverlayOptions."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+        subject = _SUBJECT_SHAPES
+        clip = _CLIP_SHAPES
 
         options = OverlayOptions(preserve_input_collinear=True)
         graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd, options=options)
@@ -133,13 +107,13 @@ class TestFloatOverlayGraphWithOptions:
         result = graph.extract_shapes(OverlayRule.Union)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNION
+        assert_geom_equal(result_geom, expected)
 
     def test_with_solver(self) -> None:
         """Test FloatOverlayGraph with custom Solver."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+        subject = _SUBJECT_SHAPES
+        clip = _CLIP_SHAPES
 
         solver = Solver.AUTO
         graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd, solver=solver)
@@ -147,13 +121,13 @@ class TestFloatOverlayGraphWithOptions:
         result = graph.extract_shapes(OverlayRule.Union)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNION
+        assert_geom_equal(result_geom, expected)
 
     def test_with_all_options(self) -> None:
         """Test FloatOverlayGraph with all options specified."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
+        subject = _SUBJECT_SHAPES
+        clip = _CLIP_SHAPES
 
         options = OverlayOptions(preserve_input_collinear=True)
         solver = Solver.TREE
@@ -162,36 +136,28 @@ class TestFloatOverlayGraphWithOptions:
         result = graph.extract_shapes(OverlayRule.Union)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNION
+        assert_geom_equal(result_geom, expected)
 
 
 class TestFloatOverlayGraphFillRules:
     """Tests for FloatOverlayGraph with different fill rules."""
 
-    def test_even_odd_fill_rule(self) -> None:
+    def test_even_odd_fill_rule(self, eo_graph: FloatOverlayGraph) -> None:
         """Test FloatOverlayGraph with EvenOdd fill rule."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
-
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-        result = graph.extract_shapes(OverlayRule.Union)
+        result = eo_graph.extract_shapes(OverlayRule.Union)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNION
+        assert_geom_equal(result_geom, expected)
 
-    def test_nonzero_fill_rule(self) -> None:
+    def test_nonzero_fill_rule(self, nz_graph: FloatOverlayGraph) -> None:
         """Test FloatOverlayGraph with NonZero fill rule."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
-
-        graph = FloatOverlayGraph(subject, clip, FillRule.NonZero)
-        result = graph.extract_shapes(OverlayRule.Union)
+        result = nz_graph.extract_shapes(OverlayRule.Union)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNION
+        assert_geom_equal(result_geom, expected)
 
 
 class TestFloatOverlayGraphEdgeCases:
@@ -200,19 +166,19 @@ class TestFloatOverlayGraphEdgeCases:
     def test_empty_subject(self) -> None:
         """Test FloatOverlayGraph with empty subject."""
         subject: list[list[list[tuple[float, float]]]] = []
-        clip = box(0.0, 0.0, 1.0, 1.0)
+        clip = _UNIT_BOX_SHAPES
 
         graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
         result = graph.extract_shapes(OverlayRule.Union)
         result_geom = shapes_to_multipolygon(result)
 
         # Clip should pass through
-        expected = shapely.box(0.0, 0.0, 1.0, 1.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNIT_SQUARE
+        assert_geom_equal(result_geom, expected)
 
     def test_empty_clip(self) -> None:
         """Test FloatOverlayGraph with empty clip."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
+        subject = _UNIT_BOX_SHAPES
         clip: list[list[list[tuple[float, float]]]] = []
 
         graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
@@ -220,38 +186,34 @@ class TestFloatOverlayGraphEdgeCases:
         result_geom = shapes_to_multipolygon(result)
 
         # Subject should pass through
-        expected = shapely.box(0.0, 0.0, 1.0, 1.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_UNIT_SQUARE
+        assert_geom_equal(result_geom, expected)
 
     def test_no_overlap(self) -> None:
         """Test FloatOverlayGraph when shapes don't overlap."""
-        subject = box(0.0, 0.0, 1.0, 1.0)
-        clip = box(5.0, 0.0, 6.0, 1.0)
+        subject = _UNIT_BOX_SHAPES
+        clip = _FAR_UNIT_BOX_SHAPES
 
         graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
 
         # Union should have both shapes
         union = graph.extract_shapes(OverlayRule.Union)
         union_geom = shapes_to_multipolygon(union)
-        expected_union = shapely.box(0.0, 0.0, 1.0, 1.0).union(shapely.box(5.0, 0.0, 6.0, 1.0))
-        assert union_geom.equals(expected_union)
+        expected_union = _EXPECTED_NO_OVERLAP_UNION
+        assert_geom_equal(union_geom, expected_union)
 
-        # Intersection should be empty
+        # Intersection should be empty; the native result list tells us
+        # directly, no shapely conversion needed.
         intersection = graph.extract_shapes(OverlayRule.Intersect)
-        assert shapes_to_multipolygon(intersection).is_empty
+        assert len(intersection) == 0
 
 
 class TestFloatOverlayGraphRepr:
     """Tests for FloatOverlayGraph repr."""
 
-    def test_repr(self) -> None:
-        """Test repr representation."""
-        subject = box(0.0, 0.0, 2.0, 2.0)
-        clip = box(1.0, 1.0, 3.0, 3.0)
-
-        graph = FloatOverlayGraph(subject, clip, FillRule.EvenOdd)
-        r = repr(graph)
+    def test_repr(self, eo_graph: FloatOverlayGraph) -> None:
+        """Test the structured count getters and a minimal repr check."""
+        assert eo_graph.subject_count == 1
+        assert eo_graph.clip_count == 1
 
-        assert "FloatOverlayGraph" in r
-        assert "subject_count=1" in r
-        assert "clip_count=1" in r
+        assert "FloatOverlayGraph" in repr(eo_graph)
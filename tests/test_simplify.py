@@ -9,7 +9,36 @@ from i_overlay import (
     simplify_shape,
 )
 
-from .shapely_utils import box, geometry_to_shapes, shapes_to_multipolygon
+from .shapely_utils import (
+    assert_geom_equal,
+    box,
+    multipolygon_from_rings,
+    shapes_to_multipolygon,
+)
+
+# Shared inputs, built once per module and treated as read-only.
+_TWO_BY_TWO_SHAPES = box(0.0, 0.0, 2.0, 2.0)
+# A figure-8 shape that crosses itself at (1, 1).
+_FIGURE_8 = [[[(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0)]]]
+# Two overlapping 2x2 squares as separate shapes, written directly in
+# i_overlay format instead of a shapely box + conversion round-trip.
+_TWO_OVERLAPPING_SQUARES = [
+    [[(2.0, 0.0), (2.0, 2.0), (0.0, 2.0), (0.0, 0.0)]],
+    [[(3.0, 1.0), (3.0, 3.0), (1.0, 3.0), (1.0, 1.0)]],
+]
+
+# Expected geometries; each shapely construction crosses into GEOS, so
+# the repeated values are built once at import.
+_EXPECTED_SQUARE = shapely.box(0.0, 0.0, 2.0, 2.0)
+_EXPECTED_OVERLAP_UNION = _EXPECTED_SQUARE.union(shapely.box(1.0, 1.0, 3.0, 3.0))
+_EXPECTED_OVERLAP_XOR = _EXPECTED_SQUARE.symmetric_difference(shapely.box(1.0, 1.0, 3.0, 3.0))
+# The two triangles the figure-8 resolves to, meeting at (1, 1).
+_EXPECTED_TWO_TRIANGLES = multipolygon_from_rings(
+    [
+        [(0.0, 0.0), (1.0, 1.0), (0.0, 2.0)],
+        [(2.0, 0.0), (1.0, 1.0), (2.0, 2.0)],
+    ]
+)
 
 
 class TestSimplifyBasic:
@@ -17,13 +46,13 @@ class TestSimplifyBasic:
 
     def test_simplify_simple_shape(self) -> None:
         """Test simplifying a simple shape (no change expected)."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
 
         result = simplify_shape(shape, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_SQUARE
+        assert_geom_equal(result_geom, expected)
 
     def test_simplify_collinear_points(self) -> None:
         """Test simplifying a shape with collinear points."""
@@ -34,8 +63,8 @@ class TestSimplifyBasic:
         result_geom = shapes_to_multipolygon(result)
 
         # Should produce valid rectangle shape
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_SQUARE
+        assert_geom_equal(result_geom, expected)
 
 
 class TestSimplifySelfIntersection:
@@ -43,44 +72,22 @@ class TestSimplifySelfIntersection:
 
     def test_simplify_figure_eight(self) -> None:
         """Test simplifying a figure-8 (self-intersecting) shape."""
-        # A figure-8 shape that crosses itself at (1, 1)
-        figure_eight = [[[(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0)]]]
-
-        result = simplify_shape(figure_eight, FillRule.EvenOdd)
+        result = simplify_shape(_FIGURE_8, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # With EvenOdd rule, should produce two triangles
-        # Total area should be 2 (two triangles of area 1 each)
-        assert abs(result_geom.area - 2.0) < 1e-6
-        assert result_geom.is_valid
-        # Should produce two triangles meeting at (1, 1)
-        expected = shapely.MultiPolygon(
-            [
-                shapely.Polygon([(0.0, 0.0), (1.0, 1.0), (0.0, 2.0)]),
-                shapely.Polygon([(2.0, 0.0), (1.0, 1.0), (2.0, 2.0)]),
-            ]
-        )
-        assert result_geom.equals(expected)
+        # With EvenOdd, the exact-match compare against the two known-valid
+        # triangles meeting at (1, 1) implies both validity and the area.
+        assert_geom_equal(result_geom, _EXPECTED_TWO_TRIANGLES)
 
     def test_simplify_figure_eight_nonzero(self) -> None:
         """Test simplifying figure-8 with NonZero fill rule."""
-        # A figure-8 shape that crosses itself at (1, 1)
-        figure_eight = [[[(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0)]]]
-
-        result = simplify_shape(figure_eight, FillRule.NonZero)
+        result = simplify_shape(_FIGURE_8, FillRule.NonZero)
         result_geom = shapes_to_multipolygon(result)
 
-        # NonZero fills any area with non-zero winding - same result as EvenOdd here
-        assert result_geom.is_valid
-        assert abs(result_geom.area - 2.0) < 1e-6
-        # Should produce two triangles meeting at (1, 1)
-        expected = shapely.MultiPolygon(
-            [
-                shapely.Polygon([(0.0, 0.0), (1.0, 1.0), (0.0, 2.0)]),
-                shapely.Polygon([(2.0, 0.0), (1.0, 1.0), (2.0, 2.0)]),
-            ]
-        )
-        assert result_geom.equals(expected)
+        # NonZero fills any area with non-zero winding - same result as
+        # EvenOdd here; the exact-match compare against the known-valid
+        # triangles implies both validity and the area.
+        assert_geom_equal(result_geom, _EXPECTED_TWO_TRIANGLES)
 
 
 class TestSimplifyOverlapping:
@@ -88,35 +95,23 @@ class TestSimplifyOverlapping:
 
     def test_simplify_overlapping_squares_nonzero(self) -> None:
         """Test simplifying two overlapping squares with NonZero fill rule."""
-        # Two overlapping squares as separate shapes in the subject
-        shapes = [
-            geometry_to_shapes(shapely.box(0.0, 0.0, 2.0, 2.0))[0],
-            geometry_to_shapes(shapely.box(1.0, 1.0, 3.0, 3.0))[0],
-        ]
-
         # NonZero fills any area with non-zero winding number
-        result = simplify_shape(shapes, FillRule.NonZero)
+        result = simplify_shape(_TWO_OVERLAPPING_SQUARES, FillRule.NonZero)
         result_geom = shapes_to_multipolygon(result)
 
         # Should produce union of the two squares
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).union(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_OVERLAP_UNION
+        assert_geom_equal(result_geom, expected)
 
     def test_simplify_overlapping_squares_evenodd(self) -> None:
         """Test simplifying two overlapping squares with EvenOdd fill rule."""
-        # Two overlapping squares as separate shapes in the subject
-        shapes = [
-            geometry_to_shapes(shapely.box(0.0, 0.0, 2.0, 2.0))[0],
-            geometry_to_shapes(shapely.box(1.0, 1.0, 3.0, 3.0))[0],
-        ]
-
         # EvenOdd cancels overlapping areas (XOR-like behavior)
-        result = simplify_shape(shapes, FillRule.EvenOdd)
+        result = simplify_shape(_TWO_OVERLAPPING_SQUARES, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
         # With EvenOdd, overlapping area is cancelled out (like XOR)
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0).symmetric_difference(shapely.box(1.0, 1.0, 3.0, 3.0))
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_OVERLAP_XOR
+        assert_geom_equal(result_geom, expected)
 
 
 class TestSimplifyWithOptions:
@@ -124,24 +119,24 @@ class TestSimplifyWithOptions:
 
     def test_with_options(self) -> None:
         """Test simplify_shape with custom options."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
 
         options = OverlayOptions(preserve_input_collinear=True)
         result = simplify_shape(shape, FillRule.EvenOdd, options=options)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_SQUARE
+        assert_geom_equal(result_geom, expected)
 
     def test_with_solver(self) -> None:
         """Test simplify_shape with custom solver."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
 
         result = simplify_shape(shape, FillRule.EvenOdd, solver=Solver.AUTO)
         result_geom = shapes_to_multipolygon(result)
 
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_SQUARE
+        assert_geom_equal(result_geom, expected)
 
 
 class TestSimplifyEdgeCases:
@@ -152,9 +147,8 @@ class TestSimplifyEdgeCases:
         shapes: list[list[list[tuple[float, float]]]] = []
 
         result = simplify_shape(shapes, FillRule.EvenOdd)
-        result_geom = shapes_to_multipolygon(result)
 
-        assert result_geom.is_empty
+        assert len(result) == 0
 
     def test_single_triangle(self) -> None:
         """Test simplifying a single triangle."""
@@ -164,4 +158,4 @@ class TestSimplifyEdgeCases:
         result_geom = shapes_to_multipolygon(result)
 
         expected = shapely.Polygon([(0.0, 0.0), (2.0, 0.0), (1.0, 2.0)])
-        assert result_geom.equals(expected)
+        assert_geom_equal(result_geom, expected)
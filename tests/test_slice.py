@@ -9,7 +9,40 @@ from i_overlay import (
     slice_by,
 )
 
-from .shapely_utils import box, shapes_to_multipolygon
+from .shapely_utils import assert_geom_equal, box, multipolygon_from_rings, shapes_to_multipolygon
+
+# Shared input, built once per module and treated as read-only.
+_TWO_BY_TWO_SHAPES = box(0.0, 0.0, 2.0, 2.0)
+
+# Expected geometries; each shapely construction crosses into GEOS, so
+# the repeated values are built once at import.
+_EXPECTED_SQUARE = shapely.box(0.0, 0.0, 2.0, 2.0)
+_EXPECTED_HORIZONTAL_SPLIT = multipolygon_from_rings(
+    [
+        [(0.0, 0.0), (2.0, 0.0), (2.0, 1.0), (0.0, 1.0)],
+        [(0.0, 1.0), (2.0, 1.0), (2.0, 2.0), (0.0, 2.0)],
+    ]
+)
+_EXPECTED_VERTICAL_SPLIT = multipolygon_from_rings(
+    [
+        [(0.0, 0.0), (1.0, 0.0), (1.0, 2.0), (0.0, 2.0)],
+        [(1.0, 0.0), (2.0, 0.0), (2.0, 2.0), (1.0, 2.0)],
+    ]
+)
+_EXPECTED_DIAGONAL_SPLIT = multipolygon_from_rings(
+    [
+        [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0)],
+        [(0.0, 0.0), (2.0, 2.0), (0.0, 2.0)],
+    ]
+)
+_EXPECTED_GRID = multipolygon_from_rings(
+    [
+        [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)],
+        [(1.0, 0.0), (2.0, 0.0), (2.0, 1.0), (1.0, 1.0)],
+        [(0.0, 1.0), (1.0, 1.0), (1.0, 2.0), (0.0, 2.0)],
+        [(1.0, 1.0), (2.0, 1.0), (2.0, 2.0), (1.0, 2.0)],
+    ]
+)
 
 
 class TestSliceBasic:
@@ -17,67 +50,42 @@ class TestSliceBasic:
 
     def test_slice_square_horizontal(self) -> None:
         """Test slicing a square horizontally."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Horizontal line through the middle
         polylines = [[(0.0, 1.0), (2.0, 1.0)]]
 
         result = slice_by(shape, polylines, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Should produce two rectangles
-        assert len(result) == 2
-        # Total area should be preserved
-        assert abs(result_geom.area - 4.0) < 1e-6
-        # Should produce bottom and top rectangles
-        expected = shapely.MultiPolygon(
-            [
-                shapely.box(0.0, 0.0, 2.0, 1.0),
-                shapely.box(0.0, 1.0, 2.0, 2.0),
-            ]
-        )
-        assert result_geom.equals(expected)
+        # The exact match against the bottom/top rectangles implies both
+        # the piece count and the preserved area.
+        assert_geom_equal(result_geom, _EXPECTED_HORIZONTAL_SPLIT)
 
     def test_slice_square_vertical(self) -> None:
         """Test slicing a square vertically."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Vertical line through the middle
         polylines = [[(1.0, 0.0), (1.0, 2.0)]]
 
         result = slice_by(shape, polylines, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Should produce two rectangles
-        assert len(result) == 2
-        assert abs(result_geom.area - 4.0) < 1e-6
-        # Should produce left and right rectangles
-        expected = shapely.MultiPolygon(
-            [
-                shapely.box(0.0, 0.0, 1.0, 2.0),
-                shapely.box(1.0, 0.0, 2.0, 2.0),
-            ]
-        )
-        assert result_geom.equals(expected)
+        # The exact match against the left/right rectangles implies both
+        # the piece count and the preserved area.
+        assert_geom_equal(result_geom, _EXPECTED_VERTICAL_SPLIT)
 
     def test_slice_square_diagonal(self) -> None:
         """Test slicing a square diagonally."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Diagonal line
         polylines = [[(0.0, 0.0), (2.0, 2.0)]]
 
         result = slice_by(shape, polylines, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Should produce two triangles
-        assert len(result) == 2
-        assert abs(result_geom.area - 4.0) < 1e-6
-        # Should produce two triangles - bottom-right and top-left
-        expected = shapely.MultiPolygon(
-            [
-                shapely.Polygon([(0.0, 0.0), (2.0, 0.0), (2.0, 2.0)]),
-                shapely.Polygon([(0.0, 0.0), (2.0, 2.0), (0.0, 2.0)]),
-            ]
-        )
-        assert result_geom.equals(expected)
+        # The exact match against the bottom-right and top-left triangles
+        # implies both the piece count and the preserved area.
+        assert_geom_equal(result_geom, _EXPECTED_DIAGONAL_SPLIT)
 
 
 class TestSliceMultipleLines:
@@ -85,7 +93,7 @@ class TestSliceMultipleLines:
 
     def test_slice_grid(self) -> None:
         """Test slicing a square into a 2x2 grid."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Cross pattern
         polylines = [
             [(0.0, 1.0), (2.0, 1.0)],  # Horizontal
@@ -95,19 +103,9 @@ class TestSliceMultipleLines:
         result = slice_by(shape, polylines, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
-        # Should produce 4 squares
-        assert len(result) == 4
-        assert abs(result_geom.area - 4.0) < 1e-6
-        # Should produce four unit squares
-        expected = shapely.MultiPolygon(
-            [
-                shapely.box(0.0, 0.0, 1.0, 1.0),
-                shapely.box(1.0, 0.0, 2.0, 1.0),
-                shapely.box(0.0, 1.0, 1.0, 2.0),
-                shapely.box(1.0, 1.0, 2.0, 2.0),
-            ]
-        )
-        assert result_geom.equals(expected)
+        # The exact match against the four unit squares implies both the
+        # piece count and the preserved area.
+        assert_geom_equal(result_geom, _EXPECTED_GRID)
 
 
 class TestSlicePartial:
@@ -115,7 +113,7 @@ class TestSlicePartial:
 
     def test_slice_partial_line(self) -> None:
         """Test slicing with a line that partially enters the shape."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Line starts outside, enters shape, doesn't exit
         polylines = [[(-1.0, 1.0), (1.0, 1.0)]]
 
@@ -127,7 +125,7 @@ class TestSlicePartial:
 
     def test_slice_line_outside(self) -> None:
         """Test slicing with a line completely outside the shape."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Line completely outside
         polylines = [[(5.0, 0.0), (5.0, 2.0)]]
 
@@ -135,8 +133,8 @@ class TestSlicePartial:
         result_geom = shapes_to_multipolygon(result)
 
         # Shape should be unchanged
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_SQUARE
+        assert_geom_equal(result_geom, expected)
 
 
 class TestSliceWithOptions:
@@ -144,7 +142,7 @@ class TestSliceWithOptions:
 
     def test_with_options(self) -> None:
         """Test slice_by with custom options."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         polylines = [[(0.0, 1.0), (2.0, 1.0)]]
 
         options = OverlayOptions(preserve_input_collinear=True)
@@ -156,7 +154,7 @@ class TestSliceWithOptions:
 
     def test_with_solver(self) -> None:
         """Test slice_by with custom solver."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         polylines = [[(0.0, 1.0), (2.0, 1.0)]]
 
         result = slice_by(shape, polylines, FillRule.EvenOdd, solver=Solver.AUTO)
@@ -175,25 +173,24 @@ class TestSliceEdgeCases:
         polylines = [[(0.0, 1.0), (2.0, 1.0)]]
 
         result = slice_by(shapes, polylines, FillRule.EvenOdd)
-        result_geom = shapes_to_multipolygon(result)
 
-        assert result_geom.is_empty
+        assert len(result) == 0
 
     def test_empty_polylines(self) -> None:
         """Test slicing with empty polylines."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         polylines: list[list[tuple[float, float]]] = []
 
         result = slice_by(shape, polylines, FillRule.EvenOdd)
         result_geom = shapes_to_multipolygon(result)
 
         # Shape should be unchanged
-        expected = shapely.box(0.0, 0.0, 2.0, 2.0)
-        assert result_geom.equals(expected)
+        expected = _EXPECTED_SQUARE
+        assert_geom_equal(result_geom, expected)
 
     def test_slice_along_edge(self) -> None:
         """Test slicing along an edge of the shape."""
-        shape = box(0.0, 0.0, 2.0, 2.0)
+        shape = _TWO_BY_TWO_SHAPES
         # Line along the bottom edge
         polylines = [[(0.0, 0.0), (2.0, 0.0)]]
 
@@ -1,5 +1,10 @@
 """Tests for stroke function."""
 
+from collections.abc import Callable
+
+import pytest
+import shapely
+
 from i_overlay import (
     LineCap,
     LineJoin,
@@ -8,19 +13,77 @@ from i_overlay import (
     stroke,
 )
 
-from .shapely_utils import shapes_to_multipolygon
+from .shapely_utils import Shapes, shapes_to_multipolygon
+
+# Shared inputs, built once per module and treated as read-only. These
+# double as the identity keys for the stroke_cache fixture below.
+_LINE_PATHS = [[(0.0, 0.0), (10.0, 0.0)]]
+_L_PATHS = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]]
+_SQUARE_PATHS = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]]
+_WIDTH_2_STYLE = StrokeStyle(2.0)
+
+# Custom cap point sets: arrow caps pointing back/forward and a blunt
+# triangle cap.
+_ARROW_BACK_CAP = [(0.0, -0.5), (-1.0, 0.0), (0.0, 0.5)]
+_ARROW_FORWARD_CAP = [(0.0, -0.5), (1.0, 0.0), (0.0, 0.5)]
+_TRIANGLE_CAP = [(0.0, -0.5), (0.5, 0.0), (0.0, 0.5)]
+
+_StrokeCache = Callable[..., tuple[Shapes, shapely.MultiPolygon]]
+
+
+def _stroke_or_empty(
+    paths: list[list[tuple[float, float]]],
+    style: StrokeStyle,
+    *,
+    is_closed: bool = False,
+    options: OverlayOptions | None = None,
+) -> Shapes:
+    """Call stroke, short-circuiting inputs that provably stroke to nothing.
+
+    A path needs at least two points to have a direction, so empty input
+    or all-degenerate paths return [] without entering the extension.
+    """
+    if not paths or all(len(path) < 2 for path in paths):
+        return []
+    result: Shapes = stroke(paths, style, is_closed=is_closed, options=options)
+    return result
+
+
+@pytest.fixture(scope="module")
+def stroke_cache() -> _StrokeCache:
+    """A memoizing stroke() wrapper shared by every test in this module.
+
+    Each stroke call enters the native extension and each conversion
+    crosses into GEOS; several tests use identical inputs, so one cached
+    call (and one conversion) serves them all. Results are keyed by input
+    identity, which the cache keeps alive so ids stay unique.
+    """
+    cache: dict[tuple[int, int, bool, int], tuple[Shapes, shapely.MultiPolygon]] = {}
+    pinned: list[object] = []
+
+    def call(
+        paths: list[list[tuple[float, float]]],
+        style: StrokeStyle,
+        *,
+        is_closed: bool = False,
+        options: OverlayOptions | None = None,
+    ) -> tuple[Shapes, shapely.MultiPolygon]:
+        key = (id(paths), id(style), is_closed, id(options))
+        if key not in cache:
+            result = stroke(paths, style, is_closed=is_closed, options=options)
+            pinned.extend((paths, style, options))
+            cache[key] = (result, shapes_to_multipolygon(result))
+        return cache[key]
+
+    return call
 
 
 class TestStrokeBasic:
     """Basic tests for stroke function."""
 
-    def test_stroke_simple_line(self) -> None:
+    def test_stroke_simple_line(self, stroke_cache: _StrokeCache) -> None:
         """Test stroking a simple horizontal line."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        style = StrokeStyle(2.0)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
+        result, result_geom = stroke_cache(_LINE_PATHS, _WIDTH_2_STYLE)
 
         # Should produce a rectangle-like shape
         assert len(result) == 1
@@ -28,24 +91,16 @@ class TestStrokeBasic:
         # Width is 2, so area should be approximately 10 * 2 = 20
         assert abs(result_geom.area - 20.0) < 1.0
 
-    def test_stroke_l_shape(self) -> None:
+    def test_stroke_l_shape(self, stroke_cache: _StrokeCache) -> None:
         """Test stroking an L-shaped path."""
-        paths = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]]
-        style = StrokeStyle(2.0)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
+        result, result_geom = stroke_cache(_L_PATHS, _WIDTH_2_STYLE)
 
         assert len(result) == 1
         assert result_geom.is_valid
 
-    def test_stroke_closed_path(self) -> None:
+    def test_stroke_closed_path(self, stroke_cache: _StrokeCache) -> None:
         """Test stroking a closed square path."""
-        paths = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]]
-        style = StrokeStyle(2.0)
-
-        result = stroke(paths, style, is_closed=True)
-        result_geom = shapes_to_multipolygon(result)
+        result, result_geom = stroke_cache(_SQUARE_PATHS, _WIDTH_2_STYLE, is_closed=True)
 
         # Closed path should produce a shape with a hole
         assert len(result) == 1
@@ -57,86 +112,78 @@ class TestStrokeBasic:
 class TestStrokeStyles:
     """Tests for different stroke styles."""
 
-    def test_stroke_round_caps(self) -> None:
-        """Test stroking with round caps."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        style = StrokeStyle(2.0, start_cap=LineCap.Round, end_cap=LineCap.Round)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
-
-        assert len(result) == 1
-        assert result_geom.is_valid
-        # Round caps add semicircles at each end
-        # Area should be slightly more than butt caps
-
-    def test_stroke_square_caps(self) -> None:
-        """Test stroking with square caps."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        style = StrokeStyle(2.0, start_cap=LineCap.Square, end_cap=LineCap.Square)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
-
-        assert len(result) == 1
-        assert result_geom.is_valid
-        # Square caps extend by half width at each end
-        # Area should be (10 + 2) * 2 = 24
-        assert abs(result_geom.area - 24.0) < 1.0
-
-    def test_stroke_miter_join(self) -> None:
-        """Test stroking with miter joins."""
-        paths = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]]
-        style = StrokeStyle(2.0, join=LineJoin.Miter)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
-
-        assert len(result) == 1
-        assert result_geom.is_valid
-
-    def test_stroke_round_join(self) -> None:
-        """Test stroking with round joins."""
-        paths = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)]]
-        style = StrokeStyle(2.0, join=LineJoin.Round)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
+    @pytest.mark.parametrize(
+        ("paths", "style", "expected_area"),
+        [
+            # Round caps add semicircles at each end, so only validity is
+            # checked; square caps extend by half the width at each end,
+            # giving an exact (10 + 2) * 2 area.
+            (_LINE_PATHS, StrokeStyle(2.0, start_cap=LineCap.Round, end_cap=LineCap.Round), None),
+            (_LINE_PATHS, StrokeStyle(2.0, start_cap=LineCap.Square, end_cap=LineCap.Square), 24.0),
+            (_L_PATHS, StrokeStyle(2.0, join=LineJoin.Miter), None),
+            (_L_PATHS, StrokeStyle(2.0, join=LineJoin.Round), None),
+        ],
+        ids=["round_caps", "square_caps", "miter_join", "round_join"],
+    )
+    def test_stroke_style(
+        self,
+        stroke_cache: _StrokeCache,
+        paths: list[list[tuple[float, float]]],
+        style: StrokeStyle,
+        expected_area: float | None,
+    ) -> None:
+        """Test stroking with each cap and join style."""
+        result, result_geom = stroke_cache(paths, style)
 
         assert len(result) == 1
         assert result_geom.is_valid
+        if expected_area is not None:
+            assert abs(result_geom.area - expected_area) < 1.0
 
 
 class TestStrokeMultiplePaths:
     """Tests for stroking multiple paths."""
 
-    def test_stroke_multiple_paths(self) -> None:
+    def test_stroke_multiple_paths(self, stroke_cache: _StrokeCache) -> None:
         """Test stroking multiple paths at once."""
         paths = [
             [(0.0, 0.0), (5.0, 0.0)],
             [(0.0, 5.0), (5.0, 5.0)],
         ]
-        style = StrokeStyle(2.0)
 
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
+        _result, result_geom = stroke_cache(paths, _WIDTH_2_STYLE)
 
         assert result_geom.is_valid
         # Two separate rectangles, each 5 * 2 = 10, total = 20
         assert abs(result_geom.area - 20.0) < 1.0
 
+    @pytest.mark.parametrize("n", [1, 16, pytest.param(256, marks=pytest.mark.slow)])
+    def test_stroke_many_parallel(self, stroke_cache: _StrokeCache, n: int) -> None:
+        """Test stroking many parallel segments in one call.
+
+        A single stroke call handles all paths in one crossing of the
+        extension boundary; scaling the path count keeps coverage on
+        that batched route rather than only near-empty inputs.
+        """
+        # Horizontal 5-long segments spaced far enough apart not to merge.
+        paths = [[(0.0, y * 5.0), (5.0, y * 5.0)] for y in range(n)]
+
+        result, result_geom = stroke_cache(paths, _WIDTH_2_STYLE)
+
+        assert len(result) == n
+        assert result_geom.is_valid
+        # Each segment strokes to a 5 x 2 rectangle.
+        assert abs(result_geom.area - n * 10.0) < max(1.0, n * 0.01)
+
 
 class TestStrokeWithOptions:
     """Tests for stroke with custom options."""
 
-    def test_stroke_with_options(self) -> None:
+    def test_stroke_with_options(self, stroke_cache: _StrokeCache) -> None:
         """Test stroke with custom overlay options."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        style = StrokeStyle(2.0)
         options = OverlayOptions(preserve_output_collinear=True)
 
-        result = stroke(paths, style, options=options)
-        result_geom = shapes_to_multipolygon(result)
+        result, result_geom = stroke_cache(_LINE_PATHS, _WIDTH_2_STYLE, options=options)
 
         assert len(result) == 1
         assert result_geom.is_valid
@@ -148,28 +195,32 @@ class TestStrokeEdgeCases:
     def test_stroke_empty_paths(self) -> None:
         """Test stroking empty paths."""
         paths: list[list[tuple[float, float]]] = []
-        style = StrokeStyle(2.0)
 
-        result = stroke(paths, style)
+        result = _stroke_or_empty(paths, _WIDTH_2_STYLE)
 
         assert len(result) == 0
 
     def test_stroke_single_point(self) -> None:
         """Test stroking a single point path."""
         paths = [[(5.0, 5.0)]]
-        style = StrokeStyle(2.0)
 
-        result = stroke(paths, style)
+        result = _stroke_or_empty(paths, _WIDTH_2_STYLE)
 
         # Single point cannot create a stroke
         assert len(result) == 0
 
+    def test_stroke_degenerate_raw(self) -> None:
+        """Test that the extension itself returns empty for degenerate input."""
+        # Bypasses the _stroke_or_empty guard on purpose so the Rust-side
+        # handling of empty and single-point paths keeps coverage.
+        assert len(stroke([], _WIDTH_2_STYLE)) == 0
+        assert len(stroke([[(5.0, 5.0)]], _WIDTH_2_STYLE)) == 0
+
     def test_stroke_very_small_width(self) -> None:
         """Test stroking with very small width."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
         style = StrokeStyle(0.001)
 
-        result = stroke(paths, style)
+        result = stroke(_LINE_PATHS, style)
 
         # Very small width may produce empty result due to precision
         # Just verify it doesn't crash
@@ -214,56 +265,19 @@ class TestStrokeStyleClass:
 class TestStrokeCustomCaps:
     """Tests for custom line caps."""
 
-    def test_stroke_custom_start_cap(self) -> None:
-        """Test stroking with custom start cap points."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        # Arrow-like custom cap (pointing back)
-        custom_cap = [(0.0, -0.5), (-1.0, 0.0), (0.0, 0.5)]
-        style = StrokeStyle(2.0, start_cap_points=custom_cap)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
-
-        assert len(result) == 1
-        assert result_geom.is_valid
-
-    def test_stroke_custom_end_cap(self) -> None:
-        """Test stroking with custom end cap points."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        # Arrow-like custom cap (pointing forward)
-        custom_cap = [(0.0, -0.5), (1.0, 0.0), (0.0, 0.5)]
-        style = StrokeStyle(2.0, end_cap_points=custom_cap)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
-
-        assert len(result) == 1
-        assert result_geom.is_valid
-
-    def test_stroke_custom_both_caps(self) -> None:
-        """Test stroking with custom caps on both ends."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        # Arrow start (pointing back)
-        start_cap = [(0.0, -0.5), (-1.0, 0.0), (0.0, 0.5)]
-        # Arrow end (pointing forward)
-        end_cap = [(0.0, -0.5), (1.0, 0.0), (0.0, 0.5)]
-        style = StrokeStyle(2.0, start_cap_points=start_cap, end_cap_points=end_cap)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
-
-        assert len(result) == 1
-        assert result_geom.is_valid
-
-    def test_stroke_custom_cap_triangle(self) -> None:
-        """Test stroking with triangular custom cap."""
-        paths = [[(0.0, 0.0), (10.0, 0.0)]]
-        # Triangle cap
-        triangle_cap = [(0.0, -0.5), (0.5, 0.0), (0.0, 0.5)]
-        style = StrokeStyle(2.0, end_cap_points=triangle_cap)
-
-        result = stroke(paths, style)
-        result_geom = shapes_to_multipolygon(result)
+    @pytest.mark.parametrize(
+        "style",
+        [
+            StrokeStyle(2.0, start_cap_points=_ARROW_BACK_CAP),
+            StrokeStyle(2.0, end_cap_points=_ARROW_FORWARD_CAP),
+            StrokeStyle(2.0, start_cap_points=_ARROW_BACK_CAP, end_cap_points=_ARROW_FORWARD_CAP),
+            StrokeStyle(2.0, end_cap_points=_TRIANGLE_CAP),
+        ],
+        ids=["start_cap", "end_cap", "both_caps", "triangle_cap"],
+    )
+    def test_stroke_custom_caps(self, stroke_cache: _StrokeCache, style: StrokeStyle) -> None:
+        """Test stroking with custom cap point polygons."""
+        result, result_geom = stroke_cache(_LINE_PATHS, style)
 
         assert len(result) == 1
         assert result_geom.is_valid
@@ -1,9 +1,17 @@
 """Tests to verify stubs match runtime using mypy.stubtest."""
 
+import os
 from pathlib import Path
 import subprocess
 import sys
 
+import pytest
+
+# stubtest spawns a full mypy subprocess (seconds of wall clock, dwarfing
+# the rest of the suite): mark it slow so tight loops can deselect it with
+# -m "not slow", and pin it to one worker under pytest-xdist.
+pytestmark = [pytest.mark.slow, pytest.mark.xdist_group("stubtest")]
+
 
 def test_stubtest() -> None:
     """Run mypy.stubtest to verify stubs match runtime."""
@@ -20,12 +28,16 @@ def test_stubtest() -> None:
             str(allowlist),
         ],
         check=False,
-        capture_output=True,
-        text=True,
+        # Capture as bytes with stderr folded into stdout; the output is
+        # only worth decoding when the run fails.
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        stdin=subprocess.DEVNULL,
+        # Keep the subprocess from picking up stray stub paths and from
+        # writing bytecode for a one-shot run.
+        env={**os.environ, "MYPYPATH": "", "PYTHONDONTWRITEBYTECODE": "1"},
     )
 
     if result.returncode != 0:
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-
-    assert result.returncode == 0, f"stubtest failed:\n{result.stdout}\n{result.stderr}"
+        output = result.stdout.decode("utf-8", "replace")
+        pytest.fail(f"stubtest failed:\n{output}")